@@ -42,7 +42,7 @@ def run() -> None:
     # Load config first to get settings
     config = load_config()
     logger = Logger(config.log_path)
-    tmux = TmuxManager()
+    tmux = TmuxManager(logger)
 
     try:
         lock = ensure_single_instance(exit_on_conflict=False, verbose=False)
@@ -8,14 +8,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-from .models import SortMode
+from .models import DEFAULT_SORT_MODE, SortMode
 
 DEFAULT_CONFIG_PATH = Path("~/.config/tmux-dashboard/config.json").expanduser()
 DEFAULT_LOG_PATH = Path("~/.local/state/tmux-dashboard/log.jsonl").expanduser()
 DEFAULT_COLOR = "auto"
 DEFAULT_PREVIEW_LINES = 10
 DEFAULT_DRY_RUN = False
-DEFAULT_SORT_MODE = SortMode.AI_FIRST
 DEFAULT_AUTO_CREATE = True
 DEFAULT_AUTO_RENAME_ON_DETACH = True
 
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import curses
+import os
 import random
+import select
+import signal
 import subprocess
+import sys
 import time
-from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Callable
 
 from .config import Config
 from .logger import Logger
-from .models import SortMode
+from .models import DEFAULT_SORT_MODE, SessionInfo, SortMode
 from .tmux_manager import TmuxError, TmuxManager
-from .ui import DashboardUI, UiState, UiStatus
+from .ui import DashboardUI, Region, UiState, UiStatus, dirty_regions
 
 
 @dataclass
@@ -21,15 +28,73 @@ class Action:
     session_name: str | None = None
 
 
+@dataclass
+class LoopContext:
+    """Mutable dashboard state shared by the main loop and the key handlers."""
+
+    stdscr: curses._CursesWindow
+    tmux: TmuxManager
+    config: Config
+    logger: Logger
+    executor: ThreadPoolExecutor
+    # Write end of the self-pipe that wakes the loop when a refresh lands
+    wakeup_fd: int
+    sessions: list[SessionInfo]
+    sort_mode: SortMode
+    status: UiStatus | None = None
+    filtered: list[SessionInfo] = field(default_factory=list)
+    selected_index: int = 0
+    filter_text: str = ""
+    in_search: bool = False
+    help_visible: bool = False
+    # Session-list refreshes after mutations run off the input loop
+    refresh_future: Future | None = None
+    restore_session: str | None = None
+    # Set when something painted over the dashboard (popups, attach)
+    full_redraw: bool = True
+
+    def schedule_refresh(self) -> None:
+        """Re-list sessions in the background; the loop absorbs the result."""
+        self.refresh_future = self.executor.submit(self.tmux.list_sessions, self.sort_mode)
+        self.refresh_future.add_done_callback(lambda _: _notify_wakeup(self.wakeup_fd))
+
+
+KeyHandler = Callable[[LoopContext], "Action | None"]
+
+# Key codes that insert a character into text inputs
+_PRINTABLE = frozenset(range(32, 127))
+# Editing keys understood by the input popup, mapped to the action they trigger
+_PROMPT_KEYS: dict[int, str] = {
+    10: "confirm",
+    13: "confirm",
+    27: "cancel",  # ESC
+    curses.KEY_BACKSPACE: "backspace",
+    127: "backspace",
+    8: "backspace",
+    curses.KEY_RESIZE: "resize",
+}
+
+# Set by the SIGWINCH handler; the new size is applied outside the handler
+_resize_pending = False
+
+
 def run_dashboard(
     tmux: TmuxManager,
     config: Config,
     logger: Logger,
     pending_status: object | None = None,
 ) -> Action | None:
-    def _main(stdscr: curses._CursesWindow) -> Action | None:
+    def _main(
+        stdscr: curses._CursesWindow,
+        executor: ThreadPoolExecutor,
+        wakeup_r: int,
+        wakeup_w: int,
+    ) -> Action | None:
         ui = DashboardUI(stdscr, config.color)
         ui.init()
+        # getch() never blocks; the loop sleeps in select() instead
+        stdscr.nodelay(True)
+        stdin_fd = sys.stdin.fileno()
 
         status = None
         if pending_status:
@@ -42,28 +107,49 @@ def run_dashboard(
         sessions, list_status = _safe_list_sessions(tmux, logger, sort_mode)
         if list_status:
             status = list_status
-        selected_index = 0
-        filter_text = ""
-        in_search = False
-        help_visible = False
+        ctx = LoopContext(
+            stdscr=stdscr,
+            tmux=tmux,
+            config=config,
+            logger=logger,
+            executor=executor,
+            wakeup_fd=wakeup_w,
+            sessions=sessions,
+            sort_mode=sort_mode,
+            status=status,
+        )
         last_preview_session: str | None = None
         last_preview_at = 0.0
         cached_preview = None
         cached_pane_capture = None
         preview_interval = 0.5
+        # Read once: config is only mutated by save_sort_mode, which the loop
+        # tracks through ctx.sort_mode
+        preview_lines = config.preview_lines
+        prev_state: UiState | None = None
 
         while True:
-            # Reinitialize curses state after returning from attach
-            stdscr.clear()
-            stdscr.timeout(100)
+            filter_text = ctx.filter_text
+
+            if ctx.refresh_future is not None and ctx.refresh_future.done():
+                ctx.sessions, list_status = _absorb_refresh(ctx.refresh_future, logger)
+                ctx.refresh_future = None
+                if list_status:
+                    ctx.status = list_status
+                if ctx.restore_session is not None:
+                    ctx.selected_index = _restore_selection(
+                        _filter_sessions(ctx.sessions, filter_text), ctx.restore_session, logger
+                    )
+                    ctx.restore_session = None
 
-            filtered = _filter_sessions(sessions, filter_text)
-            selected_index = _clamp_index(selected_index, len(filtered))
+            filtered = _filter_sessions(ctx.sessions, filter_text)
+            ctx.filtered = filtered
+            ctx.selected_index = _clamp_index(ctx.selected_index, len(filtered))
 
             preview = None
             pane_capture = None
-            if filtered and config.preview_lines > 0:
-                current_session = filtered[selected_index].name
+            if filtered and preview_lines > 0:
+                current_session = filtered[ctx.selected_index].name
                 now = time.monotonic()
                 should_refresh = (
                     current_session != last_preview_session
@@ -79,7 +165,7 @@ def run_dashboard(
                         last_preview_session = current_session
                         last_preview_at = now
                     except TmuxError as exc:
-                        status = UiStatus(str(exc), level="error")
+                        ctx.status = UiStatus(str(exc), level="error")
                         logger.error("preview", str(exc), current_session)
                         cached_preview = None
                         cached_pane_capture = None
@@ -91,180 +177,300 @@ def run_dashboard(
 
             state = UiState(
                 sessions=filtered,
-                selected_index=selected_index,
+                selected_index=ctx.selected_index,
                 filter_text=filter_text,
-                in_search=in_search,
-                help_visible=help_visible,
-                status=status,
+                in_search=ctx.in_search,
+                help_visible=ctx.help_visible,
+                status=ctx.status,
                 preview=preview.windows if preview else None,
                 pane_capture=pane_capture,
-                sort_mode=sort_mode,
+                sort_mode=ctx.sort_mode,
+                refreshing=ctx.refresh_future is not None,
             )
-            ui.render(state, config.preview_lines)
+            dirty = Region.ALL if ctx.full_redraw else dirty_regions(prev_state, state)
+            ctx.full_redraw = False
+            ui.render(state, preview_lines, dirty=dirty)
+            prev_state = state
 
             key = stdscr.getch()
-
-            if in_search:
-                if key == 27:  # ESC
-                    in_search = False
-                    filter_text = ""
+            if key == -1:
+                # Sleep until a key arrives, a refresh completes or the
+                # preview is due again
+                wait = preview_interval
+                if last_preview_session is not None:
+                    wait = max(0.0, last_preview_at + preview_interval - time.monotonic())
+                _wait_for_input(stdin_fd, wakeup_r, wait)
+                _apply_pending_resize()
+                key = stdscr.getch()
+                if key == -1:
                     continue
-                if key in (ord("q"), 3):
-                    return Action(kind="exit")
-                if key in (10, 13):
-                    if filtered:
-                        return Action(kind="attach", session_name=filtered[selected_index].name)
-                    status = UiStatus("No sessions match search", level="warning")
-                    continue
-                if key in (curses.KEY_BACKSPACE, 127, 8):
-                    filter_text = filter_text[:-1]
-                    continue
-                if 32 <= key <= 126:
-                    filter_text += chr(key)
-                continue
 
-            if key in (curses.KEY_F1, ord("?")):
-                help_visible = not help_visible
-                continue
+            handlers = _SEARCH_KEY_HANDLERS if ctx.in_search else _KEY_HANDLERS
+            handler = handlers.get(key)
+            if handler is not None:
+                action = handler(ctx)
+                if action is not None:
+                    return action
+            elif ctx.in_search and key in _PRINTABLE:
+                ctx.filter_text += chr(key)
+
+    def _run(stdscr: curses._CursesWindow) -> Action | None:
+        wakeup_r, wakeup_w = os.pipe()
+        os.set_blocking(wakeup_r, False)
+        os.set_blocking(wakeup_w, False)
+        previous_winch = _install_resize_handler(wakeup_w)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return _main(stdscr, executor, wakeup_r, wakeup_w)
+        finally:
+            signal.signal(signal.SIGWINCH, previous_winch)
+            os.close(wakeup_r)
+            os.close(wakeup_w)
 
-            if key == ord("/"):
-                in_search = True
-                filter_text = ""
-                continue
+    return curses.wrapper(_run)
 
-            # Quick numbered attach (keys 1-9)
-            if 49 <= key <= 57:  # Keys 1-9
-                num = key - 48  # Convert to 1-9
-                if num <= len(filtered):
-                    session_name = filtered[num - 1].name
-                    sessions, status, selected_index, _ = _attach_and_refresh(
-                        stdscr,
-                        tmux,
-                        session_name,
-                        logger,
-                        sort_mode,
-                        filter_text,
-                        auto_rename_on_detach=config.auto_rename_on_detach,
-                    )
-                    continue
-                else:
-                    status = UiStatus(f"No session #{num}", level="warning")
-                    continue
 
-            if key == curses.KEY_UP:
-                selected_index = max(0, selected_index - 1)
-                continue
-            if key == curses.KEY_DOWN:
-                selected_index = min(max(0, len(filtered) - 1), selected_index + 1)
-                continue
-            if key in (10, 13):
-                if filtered:
-                    # Handle attach within the curses context
-                    session_name = filtered[selected_index].name
-                    sessions, status, selected_index, _ = _attach_and_refresh(
-                        stdscr,
-                        tmux,
-                        session_name,
-                        logger,
-                        sort_mode,
-                        filter_text,
-                        auto_rename_on_detach=config.auto_rename_on_detach,
-                    )
-                    continue
-                status = UiStatus("No sessions to attach", level="warning")
-                continue
-            if key == ord("n"):
-                # Prompt with empty default - user can type name or press Enter for random
-                name = _prompt_input_popup(stdscr, "New tmux session", default="")
-                if name is None:
-                    status = UiStatus("Create canceled", level="warning")
-                    continue
-                # If empty, generate a funny random name
-                if not name:
-                    name = _generate_funny_name()
-                # Ensure name is unique
-                existing_names = {s.name for s in sessions}
-                if name in existing_names:
-                    base = name
-                    counter = 2
-                    while name in existing_names:
-                        name = f"{base}-{counter}"
-                        counter += 1
-                return Action(kind="create", session_name=name)
-            if key == ord("d"):
-                if not filtered:
-                    status = UiStatus("No sessions to delete", level="warning")
-                    continue
-                target = filtered[selected_index]
-                if config.dry_run:
-                    status = UiStatus("Dry-run enabled. Delete blocked.", level="warning")
-                    logger.warn("delete", "dry-run blocked delete", target.name)
-                    continue
-                warning = "Attached session" if target.attached else "Detached session"
-                confirm = _confirm_dialog(
-                    stdscr,
-                    title="Delete session",
-                    lines=[
-                        f"{warning}: {target.name}",
-                        "This will terminate running processes.",
-                        "Enter=confirm  Esc=cancel",
-                    ],
-                )
-                if confirm:
-                    try:
-                        tmux.kill_session(target.name)
-                        logger.info("delete", "session deleted", target.name)
-                        sessions, list_status = _safe_list_sessions(tmux, logger, sort_mode)
-                        status = list_status or UiStatus("Session deleted", level="info")
-                    except TmuxError as exc:
-                        logger.error("delete", str(exc), target.name)
-                        status = UiStatus(str(exc), level="error")
-                else:
-                    status = UiStatus("Delete canceled", level="warning")
-                continue
-            if key == ord("R"):  # Shift+r for rename
-                if not filtered:
-                    status = UiStatus("No sessions to rename", level="warning")
-                    continue
-                target = filtered[selected_index]
-                new_name = _prompt_input_popup(stdscr, "Rename session")
-                if new_name and new_name != target.name:
-                    try:
-                        tmux.rename_session(target.name, new_name)
-                        logger.info("rename", f"renamed {target.name} to {new_name}")
-                        sessions, list_status = _safe_list_sessions(tmux, logger, sort_mode)
-                        status = list_status or UiStatus("Session renamed", level="info")
-                    except TmuxError as exc:
-                        logger.error("rename", str(exc), target.name)
-                        status = UiStatus(str(exc), level="error")
-                elif new_name == target.name:
-                    status = UiStatus("Name unchanged", level="warning")
-                else:
-                    status = UiStatus("Rename canceled", level="warning")
-                continue
-            if key in (ord("q"), 3):
-                return Action(kind="exit")
+def _notify_wakeup(wakeup_fd: int) -> None:
+    try:
+        os.write(wakeup_fd, b"\0")
+    except OSError:
+        pass  # Pipe full (a wakeup is already pending) or closed on exit
 
-            if key == ord("r"):
-                sessions, list_status = _safe_list_sessions(tmux, logger, sort_mode)
-                status = list_status or UiStatus("Session list refreshed", level="info")
-                continue
 
-            if key == ord("s"):
-                # Cycle to next sort mode
-                new_mode = sort_mode.next_mode()
-                sort_mode = new_mode
-                # Save to config
-                config.save_sort_mode(new_mode)
-                # Re-sort sessions
-                sessions, list_status = _safe_list_sessions(tmux, logger, sort_mode)
-                status = list_status or UiStatus(f"Sort mode: {new_mode.label} ({new_mode.description})", level="info")
-                selected_index = 0  # Reset to top after re-sort
-                continue
+def _install_resize_handler(wakeup_fd: int) -> signal.Handlers | Callable:
+    """Wake the loop on SIGWINCH; returns the handler it replaced.
+
+    ncurses' own handler lets an interrupted select() resume, so a resize
+    would only show up once the wait timed out.
+    """
+
+    def _on_winch(signum: int, frame: object) -> None:
+        global _resize_pending
+        _resize_pending = True
+        _notify_wakeup(wakeup_fd)
+
+    previous = signal.signal(signal.SIGWINCH, _on_winch)
+    # None means the old handler was not installed from Python (ncurses')
+    return signal.SIG_DFL if previous is None else previous
+
+
+def _apply_pending_resize() -> None:
+    """Tell curses about a resize seen by the SIGWINCH handler.
+
+    resizeterm() updates the window sizes and queues KEY_RESIZE for the
+    next getch(), as ncurses' handler would have done.
+    """
+    global _resize_pending
+    if not _resize_pending:
+        return
+    _resize_pending = False
+    try:
+        columns, lines = os.get_terminal_size(sys.__stdout__.fileno())
+        curses.resizeterm(lines, columns)
+    except (OSError, ValueError, curses.error):
+        pass
+
+
+def _wait_for_input(stdin_fd: int, wakeup_fd: int, timeout: float) -> None:
+    try:
+        readable, _, _ = select.select([stdin_fd, wakeup_fd], [], [], timeout)
+    except (OSError, ValueError):
+        return
+    if wakeup_fd in readable:
+        try:
+            os.read(wakeup_fd, 4096)
+        except OSError:
+            pass
+
+
+def _on_exit(ctx: LoopContext) -> Action | None:
+    return Action(kind="exit")
+
+
+def _on_search_cancel(ctx: LoopContext) -> Action | None:
+    ctx.in_search = False
+    ctx.filter_text = ""
+    return None
+
+
+def _on_search_accept(ctx: LoopContext) -> Action | None:
+    if ctx.filtered:
+        return Action(kind="attach", session_name=ctx.filtered[ctx.selected_index].name)
+    ctx.status = UiStatus("No sessions match search", level="warning")
+    return None
+
+
+def _on_search_backspace(ctx: LoopContext) -> Action | None:
+    ctx.filter_text = ctx.filter_text[:-1]
+    return None
+
+
+def _on_help(ctx: LoopContext) -> Action | None:
+    ctx.help_visible = not ctx.help_visible
+    return None
+
+
+def _on_search(ctx: LoopContext) -> Action | None:
+    ctx.in_search = True
+    ctx.filter_text = ""
+    return None
+
 
+def _on_quick_attach(num: int, ctx: LoopContext) -> Action | None:
+    if num <= len(ctx.filtered):
+        _attach_and_refresh(ctx, ctx.filtered[num - 1].name)
+    else:
+        ctx.status = UiStatus(f"No session #{num}", level="warning")
+    return None
+
+
+def _on_up(ctx: LoopContext) -> Action | None:
+    ctx.selected_index = max(0, ctx.selected_index - 1)
+    return None
+
+
+def _on_down(ctx: LoopContext) -> Action | None:
+    ctx.selected_index = min(max(0, len(ctx.filtered) - 1), ctx.selected_index + 1)
+    return None
+
+
+def _on_attach(ctx: LoopContext) -> Action | None:
+    if ctx.filtered:
+        # Handle attach within the curses context
+        _attach_and_refresh(ctx, ctx.filtered[ctx.selected_index].name)
+    else:
+        ctx.status = UiStatus("No sessions to attach", level="warning")
+    return None
+
+
+def _on_new(ctx: LoopContext) -> Action | None:
+    # Prompt with empty default - user can type name or press Enter for random
+    name = _prompt_input_popup(ctx.stdscr, "New tmux session", default="")
+    ctx.full_redraw = True
+    if name is None:
+        ctx.status = UiStatus("Create canceled", level="warning")
+        return None
+    # If empty, generate a funny random name
+    if not name:
+        name = _generate_funny_name()
+    # Ensure name is unique
+    existing_names = {s.name for s in ctx.sessions}
+    if name in existing_names:
+        base = name
+        counter = 2
+        while name in existing_names:
+            name = f"{base}-{counter}"
+            counter += 1
+    return Action(kind="create", session_name=name)
+
+
+def _on_delete(ctx: LoopContext) -> Action | None:
+    if not ctx.filtered:
+        ctx.status = UiStatus("No sessions to delete", level="warning")
         return None
+    target = ctx.filtered[ctx.selected_index]
+    if ctx.config.dry_run:
+        ctx.status = UiStatus("Dry-run enabled. Delete blocked.", level="warning")
+        ctx.logger.warn("delete", "dry-run blocked delete", target.name)
+        return None
+    warning = "Attached session" if target.attached else "Detached session"
+    confirm = _confirm_dialog(
+        ctx.stdscr,
+        title="Delete session",
+        lines=[
+            f"{warning}: {target.name}",
+            "This will terminate running processes.",
+            "Enter=confirm  Esc=cancel",
+        ],
+    )
+    ctx.full_redraw = True
+    if confirm:
+        try:
+            ctx.tmux.kill_session(target.name)
+            ctx.logger.info("delete", "session deleted", target.name)
+            ctx.schedule_refresh()
+            ctx.status = UiStatus("Session deleted", level="info")
+        except TmuxError as exc:
+            ctx.logger.error("delete", str(exc), target.name)
+            ctx.status = UiStatus(str(exc), level="error")
+    else:
+        ctx.status = UiStatus("Delete canceled", level="warning")
+    return None
 
-    return curses.wrapper(_main)
+
+def _on_rename(ctx: LoopContext) -> Action | None:
+    if not ctx.filtered:
+        ctx.status = UiStatus("No sessions to rename", level="warning")
+        return None
+    target = ctx.filtered[ctx.selected_index]
+    new_name = _prompt_input_popup(ctx.stdscr, "Rename session")
+    ctx.full_redraw = True
+    if new_name and new_name != target.name:
+        try:
+            ctx.tmux.rename_session(target.name, new_name)
+            ctx.logger.info("rename", f"renamed {target.name} to {new_name}")
+            ctx.schedule_refresh()
+            ctx.status = UiStatus("Session renamed", level="info")
+        except TmuxError as exc:
+            ctx.logger.error("rename", str(exc), target.name)
+            ctx.status = UiStatus(str(exc), level="error")
+    elif new_name == target.name:
+        ctx.status = UiStatus("Name unchanged", level="warning")
+    else:
+        ctx.status = UiStatus("Rename canceled", level="warning")
+    return None
+
+
+def _on_refresh(ctx: LoopContext) -> Action | None:
+    ctx.tmux.invalidate_sessions()
+    ctx.schedule_refresh()
+    ctx.status = UiStatus("Session list refreshed", level="info")
+    return None
+
+
+def _on_sort(ctx: LoopContext) -> Action | None:
+    # Cycle to next sort mode
+    new_mode = ctx.sort_mode.next_mode()
+    ctx.sort_mode = new_mode
+    # Save to config
+    ctx.config.save_sort_mode(new_mode)
+    # Re-sort sessions
+    ctx.schedule_refresh()
+    ctx.status = UiStatus(f"Sort mode: {new_mode.label} ({new_mode.description})", level="info")
+    ctx.selected_index = 0  # Reset to top after re-sort
+    return None
+
+
+# Key dispatch tables, built once at import instead of an if-chain per keypress
+_KEY_HANDLERS: dict[int, KeyHandler] = {
+    curses.KEY_F1: _on_help,
+    ord("?"): _on_help,
+    ord("/"): _on_search,
+    # Quick numbered attach (keys 1-9)
+    **{ord(str(num)): partial(_on_quick_attach, num) for num in range(1, 10)},
+    curses.KEY_UP: _on_up,
+    curses.KEY_DOWN: _on_down,
+    10: _on_attach,
+    13: _on_attach,
+    ord("n"): _on_new,
+    ord("d"): _on_delete,
+    ord("R"): _on_rename,  # Shift+r for rename
+    ord("q"): _on_exit,
+    3: _on_exit,  # Ctrl+C
+    ord("r"): _on_refresh,
+    ord("s"): _on_sort,
+}
+
+_SEARCH_KEY_HANDLERS: dict[int, KeyHandler] = {
+    27: _on_search_cancel,  # ESC
+    ord("q"): _on_exit,
+    3: _on_exit,
+    10: _on_search_accept,
+    13: _on_search_accept,
+    curses.KEY_BACKSPACE: _on_search_backspace,
+    127: _on_search_backspace,
+    8: _on_search_backspace,
+}
 
 
 def _do_attach(
@@ -279,7 +485,8 @@ def _do_attach(
     Returns:
         The new session name if it was renamed, otherwise the original name.
     """
-    # End curses mode temporarily
+    # End curses mode temporarily, remembering the terminal modes to restore
+    curses.def_prog_mode()
     curses.endwin()
 
     try:
@@ -297,20 +504,10 @@ def _do_attach(
             if new_name:
                 logger.info("rename", f"auto-renamed session from {session_name} to {new_name}")
 
-        # Reinitialize curses after returning
-        curses.doupdate()
-        # Clear and refresh the screen
-        stdscr.clear()
-        stdscr.refresh()
-        # Re-apply UI settings
+        # Restore the saved modes; keypad/nodelay are window flags and persist.
+        # The caller's next frame repaints the screen.
         try:
-            curses.noecho()
-            curses.cbreak()
-            stdscr.keypad(True)
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
+            curses.reset_prog_mode()
         except curses.error:
             pass
 
@@ -318,42 +515,58 @@ def _do_attach(
     return new_name or session_name
 
 
-def _attach_and_refresh(
-    stdscr: curses._CursesWindow,
-    tmux: TmuxManager,
-    session_name: str,
-    logger: Logger,
-    sort_mode: SortMode,
-    filter_text: str,
-    auto_rename_on_detach: bool = True,
-) -> tuple[list, UiStatus | None, int, str]:
+def _attach_and_refresh(ctx: LoopContext, session_name: str) -> None:
+    """Attach to a session and schedule a background refresh of the list.
+
+    The cursor is restored to the (possibly renamed) session once the
+    refresh lands.
+    """
     actual_session_name = _do_attach(
-        stdscr,
-        tmux,
+        ctx.stdscr,
+        ctx.tmux,
         session_name,
-        logger,
-        auto_rename_on_detach=auto_rename_on_detach,
+        ctx.logger,
+        auto_rename_on_detach=ctx.config.auto_rename_on_detach,
     )
     if not actual_session_name:
         actual_session_name = session_name
 
-    sessions, list_status = _safe_list_sessions(tmux, logger, sort_mode)
-    status = list_status or UiStatus(f"Returned from {actual_session_name}", level="info")
-    filtered = _filter_sessions(sessions, filter_text)
-    if filtered:
-        selected_index = _find_session_index(filtered, actual_session_name)
-        if selected_index == 0 and filtered[0].name != actual_session_name:
-            session_names = [s.name for s in filtered]
-            logger.warn(
-                "cursor_restore",
-                f"Session '{actual_session_name}' not found in filtered list: {session_names}",
-            )
-    else:
-        selected_index = 0
-    return sessions, status, selected_index, actual_session_name
+    # Attaching changed the attached flags behind the manager's back
+    ctx.tmux.invalidate_sessions()
+    ctx.schedule_refresh()
+    ctx.status = UiStatus(f"Returned from {actual_session_name}", level="info")
+    ctx.restore_session = actual_session_name
+    # The terminal shows tmux output now; the first refresh after endwin()
+    # resends every line, so one full frame repaints it
+    ctx.full_redraw = True
 
 
-def _safe_list_sessions(tmux: TmuxManager, logger: Logger, sort_mode: SortMode = SortMode.DEFAULT) -> tuple[list, UiStatus | None]:
+def _absorb_refresh(future: Future, logger: Logger) -> tuple[list, UiStatus | None]:
+    """Collect the result of a background session-list refresh."""
+    try:
+        return future.result(), None
+    except TmuxError as exc:
+        logger.error("session_list", str(exc))
+        return [], UiStatus(str(exc), level="error")
+
+
+def _restore_selection(filtered: list, session_name: str, logger: Logger) -> int:
+    """Return the index of ``session_name`` in ``filtered`` after a refresh."""
+    if not filtered:
+        return 0
+    selected_index = _find_session_index(filtered, session_name)
+    if selected_index is not None:
+        return selected_index
+    # Only build the name list for the diagnostic when the lookup missed
+    session_names = [s.name for s in filtered]
+    logger.warn(
+        "cursor_restore",
+        f"Session '{session_name}' not found in filtered list: {session_names}",
+    )
+    return 0
+
+
+def _safe_list_sessions(tmux: TmuxManager, logger: Logger, sort_mode: SortMode = DEFAULT_SORT_MODE) -> tuple[list, UiStatus | None]:
     try:
         return tmux.list_sessions(sort_mode), None
     except TmuxError as exc:
@@ -374,79 +587,115 @@ def _clamp_index(index: int, length: int) -> int:
     return max(0, min(index, length - 1))
 
 
-def _find_session_index(sessions: list, session_name: str) -> int:
+def _find_session_index(sessions: list, session_name: str) -> int | None:
     """Find the index of a session by name in the session list."""
     for idx, session in enumerate(sessions):
         if session.name == session_name:
             return idx
-    return 0  # Default to first session if not found
+    return None
 
 
 def _prompt_input_popup(stdscr: curses._CursesWindow, title: str, default: str = "") -> str | None:
-    height, width = stdscr.getmaxyx()
     try:
         curses.curs_set(1)
     except curses.error:
         pass
-    stdscr.nodelay(False)
 
     prompt = "Enter session name:"
     help_text = "Enter=confirm  Esc=cancel"
-
-    # Initialize buffer with default value
-    buffer: list[str] = list(default)
-
-    while True:
-        # Clear center area
-        center_y = height // 2
-        for row in range(center_y - 2, center_y + 3):
-            _safe_addstr(stdscr, row, 0, " " * width)
-
-        # Center the text
-        title_x = max(0, (width - len(title)) // 2)
-        prompt_x = max(0, (width - len(prompt)) // 2)
-        help_x = max(0, (width - len(help_text)) // 2)
-
-        _safe_addstr(stdscr, center_y - 1, title_x, title)
-        _safe_addstr(stdscr, center_y, prompt_x, prompt)
-
-        # Draw input
-        input_display = "".join(buffer)
-        max_input_width = width - 4
-        if len(input_display) > max_input_width:
-            input_display = "~" + input_display[-(max_input_width - 1):]
-        input_x = max(2, (width - len(input_display)) // 2)
-        _safe_addstr(stdscr, center_y + 1, input_x, input_display)
+    tlen, plen, hlen = len(title), len(prompt), len(help_text)
+
+    # Keys are ASCII, so keep the input as UTF-8 bytes and decode only to draw
+    buffer = bytearray(default.encode())
+
+    def paint_static() -> tuple[curses._CursesWindow, tuple[int, int]]:
+        # Paint the static chrome; only the input row changes per keystroke
+        height, width = stdscr.getmaxyx()
+        win = _open_popup(stdscr, height // 2 - 2, 0, 5, width)
+        size = win.getmaxyx()
+        title_x = (width - tlen) // 2
+        prompt_x = (width - plen) // 2
+        help_x = (width - hlen) // 2
+        _safe_addstr(win, 1, title_x if title_x > 0 else 0, title, size)
+        _safe_addstr(win, 2, prompt_x if prompt_x > 0 else 0, prompt, size)
+        _safe_addstr(win, 4, help_x if help_x > 0 else 0, help_text, size)
+        win.noutrefresh()
+        return win, size
+
+    win, size = paint_static()
+    width = size[1]
+    max_input_width = width - 4
+    input_y = 3
+    # Per-keystroke lookups bound once
+    action_for = _PROMPT_KEYS.get
+    printable = _PRINTABLE
+    changed = True
+    try:
+        while True:
+            # Redraw the input line only, and only when the buffer or layout changed
+            if changed:
+                ilen = len(buffer)
+                if ilen > max_input_width:
+                    input_display = "~" + buffer[-(max_input_width - 1):].decode(errors="ignore")
+                else:
+                    input_display = buffer.decode(errors="ignore")
+                dlen = len(input_display)
+                input_x = (width - dlen) // 2
+                if input_x < 2:
+                    input_x = 2
+                try:
+                    win.move(input_y, 0)
+                    win.clrtoeol()
+                except curses.error:
+                    pass
+                _safe_addstr(win, input_y, input_x, input_display, size)
+                try:
+                    win.move(input_y, input_x + (dlen if dlen < max_input_width else max_input_width))
+                except curses.error:
+                    pass
+                win.noutrefresh()
+                curses.doupdate()
+                changed = False
+
+            key = win.getch()
+            if key == -1:
+                # Interrupted by SIGWINCH; the resize comes back as KEY_RESIZE
+                _apply_pending_resize()
+                continue
+            action = action_for(key)
+            if action is None:
+                if key in printable and len(buffer) < 50:
+                    buffer.append(key)
+                    changed = True
+                continue
+            if action == "confirm":
+                break
+            if action == "cancel":
+                return None
+            if action == "resize":
+                # The old layout is stale; the dashboard repaints fully once we return
+                stdscr.erase()
+                stdscr.noutrefresh()
+                win, size = paint_static()
+                width = size[1]
+                max_input_width = width - 4
+                changed = True
+            elif buffer:  # backspace
+                # Drop a whole UTF-8 sequence, not just its last byte
+                end = len(buffer) - 1
+                while end > 0 and buffer[end] & 0xC0 == 0x80:
+                    end -= 1
+                del buffer[end:]
+                changed = True
+    finally:
+        # Let the next dashboard frame repaint the area under the popup
+        stdscr.touchwin()
         try:
-            stdscr.move(center_y + 1, input_x + min(len(input_display), max_input_width))
+            curses.curs_set(0)
         except curses.error:
             pass
 
-        _safe_addstr(stdscr, center_y + 2, help_x, help_text)
-        stdscr.refresh()
-
-        key = stdscr.getch()
-        if key in (10, 13):
-            break
-        if key == 27:  # ESC
-            try:
-                curses.curs_set(0)
-            except curses.error:
-                pass
-            return None
-        if key in (curses.KEY_BACKSPACE, 127, 8):
-            if buffer:
-                buffer.pop()
-            continue
-        if 32 <= key <= 126:
-            if len(buffer) < 50:
-                buffer.append(chr(key))
-
-    try:
-        curses.curs_set(0)
-    except curses.error:
-        pass
-    value = "".join(buffer).strip()
+    value = buffer.decode(errors="ignore").strip()
     return value or None
 
 
@@ -472,39 +721,100 @@ def _confirm_dialog(
     title: str,
     lines: list[str],
 ) -> bool:
-    height, width = stdscr.getmaxyx()
-    content_width = max([len(title), *[len(line) for line in lines]])
-    box_width = min(width - 4, content_width + 4)
-    box_height = min(height - 2, len(lines) + 4)
-    top = max(1, (height - box_height) // 2)
-    left = max(1, (width - box_width) // 2)
-
-    for row in range(box_height):
-        _safe_addstr(stdscr, top + row, left, " " * box_width)
+    content_width = len(title)
+    for line in lines:
+        if len(line) > content_width:
+            content_width = len(line)
+
+    def paint() -> curses._CursesWindow:
+        height, width = stdscr.getmaxyx()
+        box_width = min(width - 4, content_width + 4)
+        box_height = min(height - 2, len(lines) + 4)
+        win = _open_popup(
+            stdscr,
+            max(1, (height - box_height) // 2),
+            max(1, (width - box_width) // 2),
+            box_height,
+            box_width,
+        )
+        # Nothing is typed here, so skip positioning the cursor on refresh
+        win.leaveok(True)
+        size = win.getmaxyx()
+        box_height, box_width = size
+
+        _safe_addstr(win, 1, 2, title[: box_width - 4], size)
+        for idx, line in enumerate(lines, start=2):
+            if idx >= box_height - 1:
+                break
+            _safe_addstr(win, idx, 2, line[: box_width - 4], size)
+        win.noutrefresh()
+        curses.doupdate()
+        return win
 
-    _safe_addstr(stdscr, top + 1, left + 2, title[: box_width - 4])
-    for idx, line in enumerate(lines, start=2):
-        if idx >= box_height - 1:
-            break
-        _safe_addstr(stdscr, top + idx, left + 2, line[: box_width - 4])
+    # The dialog is static: paint once and just wait for a decision
+    win = paint()
+    try:
+        while True:
+            key = win.getch()
+            if key == -1:
+                _apply_pending_resize()
+                continue
+            if key in (10, 13):
+                return True
+            if key == 27:
+                return False
+            if key == curses.KEY_RESIZE:
+                # Repaint here; the dashboard does its full redraw once we return
+                stdscr.erase()
+                stdscr.noutrefresh()
+                win = paint()
+    finally:
+        # Let the next dashboard frame repaint the area under the popup
+        stdscr.touchwin()
 
-    stdscr.refresh()
 
-    while True:
-        key = stdscr.getch()
-        if key in (10, 13):
-            return True
-        if key == 27:
-            return False
+def _open_popup(
+    stdscr: curses._CursesWindow,
+    top: int,
+    left: int,
+    box_height: int,
+    box_width: int,
+) -> curses._CursesWindow:
+    """Create a blank popup window, clamped to fit on the screen.
+
+    Drawing into its own window keeps each refresh limited to the popup area.
+    """
+    height, width = stdscr.getmaxyx()
+    box_height = max(1, min(box_height, height))
+    box_width = max(1, min(box_width, width))
+    top = max(0, min(top, height - box_height))
+    left = max(0, min(left, width - box_width))
+    win = curses.newwin(box_height, box_width, top, left)
+    win.keypad(True)
+    return win
 
 
-def _safe_addstr(stdscr: curses._CursesWindow, y: int, x: int, text: str) -> None:
-    height, width = stdscr.getmaxyx()
+def _safe_addstr(
+    stdscr: curses._CursesWindow,
+    y: int,
+    x: int,
+    text: str,
+    size: tuple[int, int] | None = None,
+) -> None:
+    """Write text clipped to the screen; pass ``size`` to skip getmaxyx()."""
+    if not text:
+        return
+    height, width = size if size is not None else stdscr.getmaxyx()
     if y < 0 or y >= height or x < 0 or x >= width:
         return
-    if x + len(text) >= width:
-        text = text[: max(0, width - x - 1)]
+    limit = width - x - 1
+    if limit <= 0:
+        return
+    if y < height - 1:
+        # Clipped writes only fail when the cursor would leave the bottom-right cell
+        stdscr.addnstr(y, x, text, limit)
+        return
     try:
-        stdscr.addstr(y, x, text)
+        stdscr.addnstr(y, x, text, limit)
     except curses.error:
         pass
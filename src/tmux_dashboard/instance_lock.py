@@ -18,6 +18,7 @@ import os
 import sys
 import threading
 import time
+import weakref
 from pathlib import Path
 
 # Lock file location
@@ -25,8 +26,8 @@ DEFAULT_LOCK_FILE = Path.home() / ".local" / "state" / "tmux-dashboard" / "lock"
 DEFAULT_PID_FILE = Path.home() / ".local" / "state" / "tmux-dashboard" / "pid"
 ENV_LOCK_FILE = "TMUX_DASHBOARD_LOCK_FILE"
 ENV_PID_FILE = "TMUX_DASHBOARD_PID_FILE"
-_PROCESS_LOCK = threading.Lock()
-_PROCESS_LOCK_HELD = False
+# Parent directories already created by this process
+_DIRS_CREATED: set[Path] = set()
 
 
 def _resolve_path(value: Path | None, env_var: str, default: Path) -> Path:
@@ -38,6 +39,77 @@ def _resolve_path(value: Path | None, env_var: str, default: Path) -> Path:
     return default
 
 
+def _pid_alive(pid: int) -> bool:
+    """Check whether ``pid`` refers to a running process.
+
+    Prefers a pidfd (Linux 5.3+, Python 3.9+), which needs no signal
+    permission check; falls back to ``os.kill(pid, 0)``.
+    """
+    pidfd_open = getattr(os, "pidfd_open", None)
+    if pidfd_open is not None and pid > 0:
+        try:
+            pidfd = pidfd_open(pid)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            pass  # Unsupported kernel or fd exhaustion; use the signal probe
+        else:
+            os.close(pidfd)
+            return True
+    try:
+        os.kill(pid, 0)  # Signal 0 just checks if process exists
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, owned by another user
+    return True
+
+
+def _probe_lock(lock_file: Path, pid_file: Path) -> bool:
+    """Check whether any process holds the lock, without taking it."""
+    try:
+        fd = os.open(lock_file, os.O_RDONLY | os.O_CLOEXEC)
+    except FileNotFoundError:
+        return False
+    except OSError:
+        fd = None
+
+    if fd is not None:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            return False  # We can lock it, so it's not locked
+        except OSError as exc:
+            if isinstance(exc, BlockingIOError) or exc.errno in {errno.EACCES, errno.EAGAIN}:
+                return True  # File is locked by another process
+            # Fallback to PID file check for unsupported locking
+        finally:
+            os.close(fd)
+
+    # Fallback to PID file check
+    try:
+        pid = int(pid_file.read_text().strip())
+    except (OSError, ValueError):
+        return False
+    return _pid_alive(pid)
+
+
+def _read_locking_pid(lock_file: Path, pid_file: Path) -> str | None:
+    """Return the PID recorded by the lock holder, if any.
+
+    The fcntl path keeps the PID in the lock file, the fallback path in the
+    PID file.
+    """
+    for path in (lock_file, pid_file):
+        try:
+            content = path.read_text().strip()
+        except (OSError, ValueError):
+            continue
+        if content:
+            return content
+    return None
+
+
 class InstanceLockError(Exception):
     """Base exception for instance locking errors."""
     pass
@@ -64,8 +136,13 @@ class InstanceLock:
         pid_file: Path to the PID file (optional fallback)
         _lock_fd: File descriptor for the lock file
         _pid: Process ID of the locking process
+        _OWNER: Weak reference to the instance holding the lock in this process
+        _OWNER_FD: Lock file descriptor flocked by this process, if any
     """
 
+    _OWNER: weakref.ref[InstanceLock] | None = None
+    _OWNER_FD: int | None = None
+
     def __init__(
         self,
         lock_file: Path | None = None,
@@ -85,17 +162,15 @@ class InstanceLock:
         self._lock_fd: int | None = None
         self._pid: int | None = None
         self._lock = threading.RLock()  # Internal thread safety
-        self._process_lock_acquired = False
-
-        # Ensure directories exist
-        self.lock_file.parent.mkdir(parents=True, exist_ok=True)
-        self.pid_file.parent.mkdir(parents=True, exist_ok=True)
 
     def acquire(self) -> bool:
         """Try to acquire the lock. Returns True if successful.
 
         Uses a two-phase approach:
-        1. Try file locking (fcntl) - most reliable
+        1. Try file locking (fcntl) - most reliable; the PID is stored in the
+           lock file itself, so no separate PID file is written. Non-blocking
+           attempts are retried with a short backoff until the timeout, so no
+           signal or timer of the host process is touched.
         2. Fallback to PID file check - for systems without fcntl
 
         Returns:
@@ -105,60 +180,53 @@ class InstanceLock:
             if self._lock_fd is not None:
                 return True  # Already locked
 
+            if self._held_in_process():
+                return False  # Another instance in this process holds it
+
+            self._ensure_dirs()
             start_time = time.monotonic()
             sleep_interval = 0.05
-            acquired = False
-
-            if not self._acquire_process_lock():
-                return False
-
-            try:
-                while True:
-                    fcntl_result = self._try_fcntl_lock()
-                    if fcntl_result is True:
-                        self._write_pid_file()
-                        acquired = True
-                        self._mark_process_lock_held(True)
-                        return True
-                    if fcntl_result is False:
-                        if time.monotonic() - start_time >= self.timeout:
-                            return False
-                        time.sleep(min(sleep_interval, max(0.0, self.timeout - (time.monotonic() - start_time))))
-                        continue
-
-                    # Phase 2: Fallback to PID file method
-                    if self._try_pid_file_lock():
-                        acquired = True
-                        self._mark_process_lock_held(True)
-                        return True
-
-                    if time.monotonic() - start_time >= self.timeout:
-                        return False
-
-                    time.sleep(min(sleep_interval, max(0.0, self.timeout - (time.monotonic() - start_time))))
-            finally:
-                if not acquired:
-                    self._release_process_lock()
 
-    def _acquire_process_lock(self) -> bool:
-        if self._process_lock_acquired:
-            return True
-        acquired = _PROCESS_LOCK.acquire(blocking=False)
-        self._process_lock_acquired = acquired
-        return acquired
+            while True:
+                fcntl_result = self._try_fcntl_lock()
+                if fcntl_result is True:
+                    InstanceLock._OWNER = weakref.ref(self)
+                    return True
+                if fcntl_result is False:
+                    if self._held_in_process():
+                        return False  # Lost the race to another instance in this process
+                # Phase 2: Fallback to PID file method
+                elif self._try_pid_file_lock():
+                    InstanceLock._OWNER = weakref.ref(self)
+                    return True
 
-    def _release_process_lock(self) -> None:
-        if not self._process_lock_acquired:
-            return
+                remaining = self.timeout - (time.monotonic() - start_time)
+                if remaining <= 0:
+                    return False
+                time.sleep(min(sleep_interval, remaining))
+                # Back off while the holder keeps the lock
+                sleep_interval = min(sleep_interval * 1.5, 0.25)
+
+    def _held_in_process(self) -> bool:
+        """Whether another instance in this process has flocked our lock file."""
+        owner_fd = InstanceLock._OWNER_FD
+        if owner_fd is None:
+            return False
         try:
-            _PROCESS_LOCK.release()
-        except RuntimeError:
-            pass
-        self._process_lock_acquired = False
+            return os.path.samestat(os.fstat(owner_fd), os.stat(self.lock_file))
+        except OSError:
+            return False
 
-    def _mark_process_lock_held(self, held: bool) -> None:
-        global _PROCESS_LOCK_HELD
-        _PROCESS_LOCK_HELD = held
+    def _ensure_dirs(self) -> None:
+        """Create the lock/PID directories once per process, on first acquire."""
+        for directory in (self.lock_file.parent, self.pid_file.parent):
+            if directory in _DIRS_CREATED:
+                continue
+            try:
+                directory.mkdir(parents=True, exist_ok=True)
+            except OSError:
+                continue  # Opening the files will fail and report it
+            _DIRS_CREATED.add(directory)
 
     def _try_fcntl_lock(self) -> bool | None:
         """Try to acquire lock using fcntl (Unix file locking).
@@ -168,9 +236,10 @@ class InstanceLock:
             None if fcntl locking is unavailable and PID fallback should be used.
         """
         try:
+            # No O_TRUNC: a contender must not wipe the holder's PID
             self._lock_fd = os.open(
                 self.lock_file,
-                os.O_CREAT | os.O_WRONLY | os.O_TRUNC
+                os.O_CREAT | os.O_WRONLY | os.O_CLOEXEC
             )
         except OSError:
             self._cleanup_lock_fd()
@@ -178,8 +247,7 @@ class InstanceLock:
 
         try:
             fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
-            self._pid = os.getpid()
-            os.write(self._lock_fd, str(self._pid).encode() + b"\n")
+            self._record_owner()
             return True
         except (BlockingIOError, OSError) as exc:
             self._cleanup_lock_fd()
@@ -191,13 +259,46 @@ class InstanceLock:
             self._cleanup_lock_fd()
             raise LockFileError(f"Unexpected error during fcntl lock: {exc}") from exc
 
+    def _record_owner(self) -> None:
+        """Store our PID in the lock file; caller must hold the flock."""
+        pid = os.getpid()
+        os.ftruncate(self._lock_fd, 0)
+        os.write(self._lock_fd, str(pid).encode() + b"\n")
+        # Only a fully recorded lock counts as held by this process
+        self._pid = pid
+        InstanceLock._OWNER_FD = self._lock_fd
+
     def _write_pid_file(self) -> bool:
-        """Write the current PID file. Returns True if successful."""
+        """Atomically write the current PID file. Returns True if successful.
+
+        The PID is written to a private temp file which is then renamed over
+        ``pid_file``, so readers never observe an empty or partial file.
+        """
+        self._pid = os.getpid()
+        tmp_file = self.pid_file.with_name(f"{self.pid_file.name}.tmp.{self._pid}")
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        except FileExistsError:
+            # Leftover from a crashed writer with our PID; it cannot be live
+            try:
+                os.unlink(tmp_file)
+                fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+            except OSError:
+                return False
+        except OSError:
+            return False
         try:
-            self._pid = os.getpid()
-            self.pid_file.write_text(str(self._pid))
+            try:
+                os.write(fd, str(self._pid).encode())
+            finally:
+                os.close(fd)
+            os.replace(tmp_file, self.pid_file)
             return True
         except OSError:
+            try:
+                os.unlink(tmp_file)
+            except OSError:
+                pass
             return False
 
     def _try_pid_file_lock(self) -> bool:
@@ -205,24 +306,10 @@ class InstanceLock:
         try:
             if self.pid_file.exists():
                 try:
-                    pid_content = self.pid_file.read_text().strip()
-                    if not pid_content:
-                        self.pid_file.unlink(missing_ok=True)
-                        return False
-
-                    pid = int(pid_content)
-                    # Check if process exists
-                    try:
-                        os.kill(pid, 0)  # Signal 0 just checks if process exists
-                    except ProcessLookupError:
-                        self.pid_file.unlink(missing_ok=True)
-                        pid = 0
-                    except PermissionError:
-                        return False
-
-                    if pid:
+                    pid = int(self.pid_file.read_text().strip())
+                    if _pid_alive(pid):
                         return False  # Another process owns the lock
-
+                    self.pid_file.unlink(missing_ok=True)
                 except (ValueError, OSError):
                     # Process doesn't exist or we can't check it
                     # Remove stale PID file if possible
@@ -240,64 +327,45 @@ class InstanceLock:
         """Release the lock and clean up lock files."""
         with self._lock:
             if self._lock_fd is not None:
+                if InstanceLock._OWNER_FD == self._lock_fd:
+                    InstanceLock._OWNER_FD = None
                 try:
+                    try:
+                        # Drop our PID while still holding the lock
+                        os.ftruncate(self._lock_fd, 0)
+                    except OSError:
+                        pass  # e.g. read-only remount; still unlock below
                     fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
-                    os.close(self._lock_fd)
                 except OSError:
                     pass
-                self._lock_fd = None
-
-            # Clean up PID file
-            try:
-                if self.pid_file.exists():
-                    # Only remove if it contains our PID
+                finally:
                     try:
-                        if self.pid_file.read_text().strip() == str(os.getpid()):
-                            self.pid_file.unlink()
-                    except (OSError, ValueError):
+                        os.close(self._lock_fd)
+                    except OSError:
                         pass
-            except Exception:
-                pass
+                self._lock_fd = None
+            elif self._pid is not None:
+                # PID file fallback: only remove if it contains our PID
+                try:
+                    if self.pid_file.read_text().strip() == str(os.getpid()):
+                        self.pid_file.unlink()
+                except (OSError, ValueError):
+                    pass
 
             self._pid = None
-            if self._process_lock_acquired:
-                self._mark_process_lock_held(False)
-                self._release_process_lock()
+            owner = InstanceLock._OWNER
+            if owner is not None and owner() is self:
+                InstanceLock._OWNER = None
 
     def is_locked(self) -> bool:
         """Check if the lock is currently held by any process."""
         with self._lock:
-            if _PROCESS_LOCK_HELD:
+            owner = InstanceLock._OWNER
+            if owner is not None and owner() is not None:
                 return True
             if self._lock_fd is not None:
                 return True
-
-            # Check if lock file exists and is locked
-            try:
-                with open(self.lock_file) as f:
-                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                    return False  # We can lock it, so it's not locked
-            except FileNotFoundError:
-                return False
-            except (BlockingIOError, OSError) as exc:
-                if isinstance(exc, BlockingIOError) or getattr(exc, "errno", None) in {errno.EACCES, errno.EAGAIN}:
-                    return True  # File is locked by another process
-                # Fallback to PID file check for unsupported locking
-            except Exception:
-                pass
-
-            # Fallback to PID file check
-            if self.pid_file.exists():
-                try:
-                    pid = int(self.pid_file.read_text().strip())
-                    os.kill(pid, 0)
-                    return True
-                except (ProcessLookupError, ValueError):
-                    return False
-                except PermissionError:
-                    return True
-            return False
+            return _probe_lock(self.lock_file, self.pid_file)
 
     def get_lock_info(self) -> dict[str, str | None]:
         """Get information about the current lock state.
@@ -312,27 +380,15 @@ class InstanceLock:
             "our_pid": str(self._pid) if self._pid else None,
         }
 
-        # Try to get information about the locking process
-        try:
-            if self.lock_file.exists():
-                with open(self.lock_file) as f:
-                    content = f.read().strip()
-                    if content:
-                        info["locking_pid"] = content
-                    else:
-                        info["locking_pid"] = None
-            elif self.pid_file.exists():
-                info["locking_pid"] = self.pid_file.read_text().strip()
-            else:
-                info["locking_pid"] = None
-        except Exception:
-            info["locking_pid"] = None
-
+        info["locking_pid"] = _read_locking_pid(self.lock_file, self.pid_file)
         return info
 
     def _cleanup_lock_fd(self) -> None:
         """Clean up the lock file descriptor if it exists."""
         if self._lock_fd is not None:
+            if InstanceLock._OWNER_FD == self._lock_fd:
+                # The fd number is about to be reused by later opens
+                InstanceLock._OWNER_FD = None
             try:
                 os.close(self._lock_fd)
             except OSError:
@@ -423,9 +479,7 @@ def cleanup_stale_locks(lock_file: Path | None = None, pid_file: Path | None = N
             pid_content = pid_file.read_text().strip()
             if pid_content:
                 pid = int(pid_content)
-                try:
-                    os.kill(pid, 0)  # Check if process exists
-                except ProcessLookupError:
+                if not _pid_alive(pid):
                     # Process doesn't exist, remove stale PID file
                     pid_file.unlink()
                     print(f"🧹 Removed stale PID file: {pid_file}")
@@ -435,12 +489,15 @@ def cleanup_stale_locks(lock_file: Path | None = None, pid_file: Path | None = N
     # Clean up lock file if it exists but isn't locked
     if lock_file.exists():
         try:
-            with open(lock_file) as f:
-                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
-                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
-                # File wasn't locked, remove it
-                lock_file.unlink()
-                print(f"🧹 Removed stale lock file: {lock_file}")
+            fd = os.open(lock_file, os.O_RDONLY | os.O_CLOEXEC)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+            # File wasn't locked, remove it
+            lock_file.unlink()
+            print(f"🧹 Removed stale lock file: {lock_file}")
         except OSError:
             # File is locked by another process, leave it
             pass
@@ -453,11 +510,20 @@ def cleanup_stale_locks(lock_file: Path | None = None, pid_file: Path | None = N
 # Module-level convenience functions
 def is_locked(lock_file: Path | None = None, pid_file: Path | None = None) -> bool:
     """Check if tmux-dashboard is currently locked (another instance running)."""
-    lock = InstanceLock(lock_file=lock_file, pid_file=pid_file)
-    return lock.is_locked()
+    return _probe_lock(
+        _resolve_path(lock_file, ENV_LOCK_FILE, DEFAULT_LOCK_FILE),
+        _resolve_path(pid_file, ENV_PID_FILE, DEFAULT_PID_FILE),
+    )
 
 
 def get_status(lock_file: Path | None = None, pid_file: Path | None = None) -> dict[str, str | None]:
     """Get the current lock status."""
-    lock = InstanceLock(lock_file=lock_file, pid_file=pid_file)
-    return lock.get_lock_info()
+    lock_file = _resolve_path(lock_file, ENV_LOCK_FILE, DEFAULT_LOCK_FILE)
+    pid_file = _resolve_path(pid_file, ENV_PID_FILE, DEFAULT_PID_FILE)
+    return {
+        "lock_file": str(lock_file),
+        "pid_file": str(pid_file),
+        "locked": _probe_lock(lock_file, pid_file),
+        "our_pid": None,
+        "locking_pid": _read_locking_pid(lock_file, pid_file),
+    }
@@ -2,25 +2,60 @@
 
 from __future__ import annotations
 
+import atexit
 import json
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import BinaryIO
 
 try:
     from zoneinfo import ZoneInfo
 except ImportError:  # Python < 3.9
     ZoneInfo = None  # type: ignore[assignment]
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 if ZoneInfo is not None:
     MSK_TZ = ZoneInfo("Europe/Moscow")
 else:
     MSK_TZ = timezone(timedelta(hours=3))
 
+# Record layout used without orjson; produces the same bytes as the orjson
+# path (compact separators, same key order, raw UTF-8). ts comes from
+# isoformat() and never needs escaping.
+_RECORD_TEMPLATE = '{{"ts":"{}","level":{},"event":{},"session_name":{},"message":{}}}\n'
+_encode_value = json.JSONEncoder(ensure_ascii=False).encode
+
 _WARNED_WRITE_FAILURE = False
 
+# Last formatted timestamp as (epoch milliseconds, iso string); a single
+# tuple so concurrent readers never see a mismatched pair
+_TS_CACHE: tuple[int, str] = (-1, "")
+
+
+def _timestamp() -> str:
+    """Return the current MSK time in ISO format, reusing it within a millisecond."""
+    global _TS_CACHE
+    ms = time.time_ns() // 1_000_000
+    cached_ms, cached_ts = _TS_CACHE
+    if ms == cached_ms:
+        return cached_ts
+    ts = (
+        datetime.fromtimestamp(ms // 1000, tz=MSK_TZ)
+        .replace(microsecond=(ms % 1000) * 1000)
+        .isoformat(timespec="milliseconds")
+    )
+    _TS_CACHE = (ms, ts)
+    return ts
+
 
 def _warn_write_failure(path: Path, exc: OSError) -> None:
     global _WARNED_WRITE_FAILURE
@@ -36,26 +71,63 @@ def _warn_write_failure(path: Path, exc: OSError) -> None:
 @dataclass
 class Logger:
     log_path: Path
+    # Long-lived line-buffered handle, opened on first write
+    _handle: BinaryIO | None = field(default=None, init=False, repr=False, compare=False)
+    # Lines queued by concurrent callers, flushed together by the lock holder
+    _pending: deque[bytes] = field(default_factory=deque, init=False, repr=False, compare=False)
+    _write_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    def _open(self) -> BinaryIO:
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        handle = self.log_path.open("ab")
+        atexit.register(handle.close)
+        return handle
+
+    def _write(self, line: bytes) -> None:
+        self._pending.append(line)
+        with self._write_lock:
+            if not self._pending:
+                return  # Another thread already flushed our line
+            pending = self._pending
+            lines = [pending.popleft() for _ in range(len(pending))]
+            try:
+                if self._handle is None:
+                    self._handle = self._open()
+                self._handle.write(b"".join(lines))
+                self._handle.flush()
+            except OSError as exc:
+                _warn_write_failure(self.log_path, exc)
 
-    def _write(self, record: dict[str, Any]) -> None:
-        try:
-            self.log_path.parent.mkdir(parents=True, exist_ok=True)
-            line = json.dumps(record, ensure_ascii=True)
-            with self.log_path.open("a", encoding="utf-8") as handle:
-                handle.write(line + "\n")
-        except OSError as exc:
-            _warn_write_failure(self.log_path, exc)
+    def close(self) -> None:
+        """Close the log file; a later write reopens it."""
+        with self._write_lock:
+            if self._handle is not None:
+                # Drop the exit hook from _open so closed handles are not kept alive
+                atexit.unregister(self._handle.close)
+                self._handle.close()
+                self._handle = None
 
     def log(self, level: str, event: str, message: str, session_name: str | None = None) -> None:
-        ts = datetime.now(tz=MSK_TZ).isoformat()
-        record = {
-            "ts": ts,
-            "level": level.upper(),
-            "event": event,
-            "session_name": session_name,
-            "message": message,
-        }
-        self._write(record)
+        ts = _timestamp()
+        if orjson is not None:
+            line = orjson.dumps(
+                {
+                    "ts": ts,
+                    "level": level.upper(),
+                    "event": event,
+                    "session_name": session_name,
+                    "message": message,
+                },
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
+        else:
+            encode = _encode_value
+            line = _RECORD_TEMPLATE.format(
+                ts, encode(level.upper()), encode(event), encode(session_name), encode(message)
+            ).encode("utf-8")
+        self._write(line)
 
     def info(self, event: str, message: str, session_name: str | None = None) -> None:
         self.log("INFO", event, message, session_name=session_name)
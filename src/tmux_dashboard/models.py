@@ -2,9 +2,28 @@
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from enum import Enum
 
+# dataclass() keyword arguments for slotted classes, shared by every module;
+# slots=True needs Python 3.10, older interpreters keep __dict__
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Sort mode display strings, keyed by SortMode.value
+_SORT_LABELS = {
+    "activity": "activity",
+    "name": "name",
+    "ai_first": "ai_first",
+    "windows_count": "count",
+}
+_SORT_DESCRIPTIONS = {
+    "activity": "active → recent → name",
+    "name": "alphabetical A→Z",
+    "ai_first": "AI sessions → name",
+    "windows_count": "most windows first",
+}
+
 
 class SortMode(Enum):
     """Sorting modes for sessions/windows."""
@@ -17,30 +36,16 @@ class SortMode(Enum):
     @property
     def label(self) -> str:
         """Human-readable label for the sort mode."""
-        labels = {
-            SortMode.ACTIVITY: "activity",
-            SortMode.NAME: "name",
-            SortMode.AI_FIRST: "ai_first",
-            SortMode.WINDOWS_COUNT: "count",
-        }
-        return labels[self]
+        return _SORT_LABELS[self.value]
 
     @property
     def description(self) -> str:
         """Description of what this sort mode does."""
-        descriptions = {
-            SortMode.ACTIVITY: "active → recent → name",
-            SortMode.NAME: "alphabetical A→Z",
-            SortMode.AI_FIRST: "AI sessions → name",
-            SortMode.WINDOWS_COUNT: "most windows first",
-        }
-        return descriptions[self]
+        return _SORT_DESCRIPTIONS[self.value]
 
     def next_mode(self) -> SortMode:
         """Get the next sort mode in cycle."""
-        modes = list(SortMode)
-        current_index = modes.index(self)
-        return modes[(current_index + 1) % len(modes)]
+        return _NEXT_SORT_MODE[self]
 
     @classmethod
     def from_string(cls, value: str) -> SortMode:
@@ -48,25 +53,31 @@ class SortMode(Enum):
         for mode in cls:
             if mode.value == value.lower():
                 return mode
-        return cls.DEFAULT
+        return DEFAULT_SORT_MODE
+
+
+# Default sort mode
+DEFAULT_SORT_MODE = SortMode.AI_FIRST
 
-    # Default sort mode
-    DEFAULT: SortMode = AI_FIRST
+# Sort mode cycle order, precomputed from the enum definition order
+_NEXT_SORT_MODE = {
+    mode: list(SortMode)[(index + 1) % len(SortMode)] for index, mode in enumerate(SortMode)
+}
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class PaneInfo:
     pane_id: str
     current_command: str | None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class WindowInfo:
     name: str
     panes: list[PaneInfo]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class SessionInfo:
     name: str
     attached: bool
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import functools
 import os
+import re
 import subprocess
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
+from typing import Callable
 
-from .models import PaneInfo, SessionInfo, SortMode, WindowInfo
+from .logger import Logger
+from .models import DATACLASS_SLOTS, DEFAULT_SORT_MODE, PaneInfo, SessionInfo, SortMode, WindowInfo
 
 # Keywords to detect AI agent sessions
 AI_KEYWORDS = [
@@ -28,20 +33,162 @@ try:
 except ImportError:  # pragma: no cover - optional dependency
     libtmux = None
 
+try:
+    import ahocorasick  # type: ignore
+except ImportError:  # pragma: no cover - optional dependency
+    ahocorasick = None
+
+if ahocorasick is not None:
+    # One automaton scans a string for every keyword in a single pass
+    _AI_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in AI_KEYWORDS:
+        _AI_AUTOMATON.add_word(_keyword, _keyword)
+    _AI_AUTOMATON.make_automaton()
+    del _keyword
+else:
+    _AI_AUTOMATON = None
+
+# Pane commands are usually a bare program name, so try exact matches first
+_AI_KEYWORD_SET = frozenset(AI_KEYWORDS)
+
+# Without pyahocorasick, one C-level regex scan replaces a Python loop of `in` tests
+_AI_RE = re.compile("|".join(map(re.escape, AI_KEYWORDS)), re.IGNORECASE)
+
+
+def _safe_int(value: str | bytes) -> int:
+    """Parse a tmux numeric field, treating anything unparsable as 0."""
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def _contains_ai_keyword(value: str) -> bool:
+    """Return True if ``value`` mentions any of ``AI_KEYWORDS`` (case-insensitive)."""
+    if _AI_AUTOMATON is not None:
+        return next(_AI_AUTOMATON.iter(value.lower()), None) is not None
+    return _AI_RE.search(value) is not None
+
+
+# libtmux names for the active window/pane, oldest API first
+_ACTIVE_WINDOW_ATTRS = ("attached_window", "active_window")
+_ACTIVE_PANE_ATTRS = ("attached_pane", "active_pane")
+
+# Upper bound on remembered AI detection results
+_AI_SESSION_CACHE_SIZE = 256
+
+# Seconds a session listing is reused before tmux is queried again
+_SESSIONS_TTL = 0.5
+
+# Lines of pane output kept for the live preview
+_PREVIEW_TAIL_LINES = 15
+
+# Marks a per-instance cache slot that has not been filled yet
+_UNSET: object = object()
+
+
+# Sort key per mode; ties are broken by case-insensitive name
+_SORT_KEYS: dict[SortMode, Callable[[SessionInfo], tuple]] = {
+    # Alphabetical A→Z
+    SortMode.NAME: lambda s: (s.name.lower(),),
+    # Active/attached first, then by name
+    SortMode.ACTIVITY: lambda s: (not s.attached, s.name.lower()),
+    # Most windows first, then by name
+    SortMode.WINDOWS_COUNT: lambda s: (-s.windows, s.name.lower()),
+    # AI sessions first, then by name
+    SortMode.AI_FIRST: lambda s: (not s.is_ai_session, s.name.lower()),
+}
+
 
 class TmuxError(RuntimeError):
     pass
 
 
-@dataclass
+def _invalidates_sessions(method: Callable) -> Callable:
+    """Drop the cached session listing once a mutating method has run.
+
+    Invalidating afterwards (even on error) also discards any listing that
+    was taken while the mutation was in flight.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self: TmuxManager, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self.invalidate_sessions()
+
+    return wrapper
+
+
+@dataclass(**DATACLASS_SLOTS)
 class SessionDetails:
     windows: list[WindowInfo]
 
 
+# Session names cannot contain ":", so the first "::" ends the name
+_PANE_SNAPSHOT_FORMAT = "#{session_name}::#{pane_current_command}"
+_SESSION_FORMAT = "#{session_name}:#{session_attached}:#{session_windows}"
+
+# argv for the refresh-path tmux calls, built once; per-session calls splice
+# the target between a prefix and a format suffix
+_LIST_SESSIONS_AND_PANES_ARGS = (
+    "tmux",
+    "list-sessions", "-F", "S" + _SESSION_FORMAT, ";",
+    "list-panes", "-a", "-F", "P" + _PANE_SNAPSHOT_FORMAT,
+)
+_LIST_PANES_ARGS = ("tmux", "list-panes", "-t")
+_LIST_PANES_F_COMMANDS = ("-F", "#{pane_current_command}")
+_LIST_PANES_F_PATHS = ("-F", "#{window_active}::#{pane_active}::#{pane_current_path}")
+
+
+def _escape_tmux_arg(value: str) -> str:
+    """Escape a trailing ";" so tmux does not read it as a command separator."""
+    if value.endswith(";"):
+        return value[:-1] + "\\;"
+    return value
+
+
+def _parse_session_line(line: bytes) -> SessionInfo:
+    """Parse one ``_SESSION_FORMAT`` line."""
+    name, _, rest = line.partition(b":")
+    attached, _, windows = rest.partition(b":")
+    return SessionInfo(
+        name=name.decode(errors="replace"),
+        attached=_safe_int(attached) > 0,
+        windows=_safe_int(windows),
+    )
+
+
+def _add_pane_line(snapshot: dict[str, list[str]], line: bytes) -> None:
+    """Parse one ``_PANE_SNAPSHOT_FORMAT`` line into ``snapshot``."""
+    session_name, sep, command = line.partition(b"::")
+    if not sep:
+        return
+    commands = snapshot.setdefault(session_name.decode(errors="replace"), [])
+    if command:
+        commands.append(command.decode(errors="replace"))
+
+
 class TmuxManager:
-    def __init__(self) -> None:
+    # libtmux attribute names that worked last time (they differ across versions)
+    _SESSION_ACTIVE_WINDOW_ATTR: str | None = None
+    _WINDOW_ACTIVE_PANE_ATTR: str | None = None
+
+    def __init__(self, logger: Logger | None = None) -> None:
         self._libtmux = libtmux
-        self._cached_project_name: str | None = None
+        self._logger = logger
+        self._server_instance = None
+        self._cached_project_name: str | object = _UNSET
+        self._cached_cwd: str | None = None
+        # session name -> (pane commands, is_ai) from the last detection
+        self._ai_session_cache: dict[str, tuple[tuple[str, ...], bool]] = {}
+        # Background refreshes and mutations on the main thread share the cache
+        self._ai_cache_lock = threading.Lock()
+        # (monotonic time, unsorted sessions) from the last listing
+        self._sessions_cache: tuple[float, list[SessionInfo]] | None = None
+        # Bumped by every mutation so an in-flight listing is not cached
+        self._sessions_generation = 0
 
     def detect_project_name(self) -> str:
         """Detect project name from current working directory.
@@ -50,22 +197,56 @@ class TmuxManager:
         1. Use the basename of the current working directory
         2. If no basename (root), use 'default'
         """
-        if self._cached_project_name:
-            return self._cached_project_name
+        name = self._cached_project_name
+        if name is not _UNSET:
+            return name  # type: ignore[return-value]
 
-        cwd = Path.cwd()
-
-        name = cwd.name or "default"
+        name = os.path.basename(self._cwd()) or "default"
         self._cached_project_name = name
-        return self._cached_project_name
+        return name
+
+    def _cwd(self) -> str:
+        """Return the working directory, read once per instance."""
+        if self._cached_cwd is None:
+            self._cached_cwd = os.getcwd()
+        return self._cached_cwd
+
+    def invalidate(self) -> None:
+        """Forget the cached working directory and project name."""
+        self._cached_cwd = None
+        self._cached_project_name = _UNSET
+
+    @classmethod
+    def _active_child(cls, obj: object, cache_attr: str, candidates: tuple[str, ...]) -> object | None:
+        """Return the active window/pane of a libtmux object.
+
+        Probes ``candidates`` in order once, then remembers the attribute name
+        that worked in ``cache_attr`` so later calls read it directly.
+        """
+        known = getattr(cls, cache_attr)
+        if known is not None:
+            try:
+                return getattr(obj, known)
+            except Exception:
+                return None
+        for name in candidates:
+            try:
+                value = getattr(obj, name)
+            except Exception:
+                continue  # Missing or deprecated in this libtmux version
+            if value is not None:
+                setattr(cls, cache_attr, name)
+                return value
+        return None
 
     @staticmethod
     def _project_name_from_path(path: str | None) -> str | None:
         if not path:
             return None
         try:
-            name = Path(path).name
-        except (TypeError, ValueError):
+            # rstrip keeps Path.name semantics for a trailing slash
+            name = os.path.basename(path.rstrip("/"))
+        except (TypeError, AttributeError):
             return None
         return name or None
 
@@ -76,12 +257,12 @@ class TmuxManager:
                 if server:
                     session = server.sessions.get(session_name=session_name)
                     if session:
-                        window = getattr(session, "attached_window", None) or getattr(session, "active_window", None)
+                        window = self._active_child(session, "_SESSION_ACTIVE_WINDOW_ATTR", _ACTIVE_WINDOW_ATTRS)
                         if window is None:
                             windows = list(session.windows)
                             window = windows[0] if windows else None
                         if window:
-                            pane = getattr(window, "attached_pane", None) or getattr(window, "active_pane", None)
+                            pane = self._active_child(window, "_WINDOW_ACTIVE_PANE_ATTR", _ACTIVE_PANE_ATTRS)
                             if pane is None:
                                 panes = list(window.panes)
                                 pane = panes[0] if panes else None
@@ -94,7 +275,7 @@ class TmuxManager:
 
         try:
             result = subprocess.run(
-                ["tmux", "list-panes", "-t", session_name, "-F", "#{window_active}::#{pane_active}::#{pane_current_path}"],
+                (*_LIST_PANES_ARGS, session_name, *_LIST_PANES_F_PATHS),
                 capture_output=True,
                 text=True,
                 timeout=2,
@@ -105,7 +286,8 @@ class TmuxManager:
             for line in result.stdout.splitlines():
                 if not line.strip():
                     continue
-                window_active, pane_active, path = (line.split("::", 2) + ["", "", ""])[:3]
+                window_active, _, rest = line.partition("::")
+                pane_active, _, path = rest.partition("::")
                 if not path:
                     continue
                 if window_active.strip() == "1" and pane_active.strip() == "1":
@@ -142,11 +324,15 @@ class TmuxManager:
         if base_name not in existing_names:
             return base_name
 
-        # Try incrementing numbers
+        # Collect the numeric suffixes already taken, then pick the first free one
+        prefix = base_name + "-"
+        prefix_len = len(prefix)
+        taken = {
+            name[prefix_len:] for name in existing_names if name.startswith(prefix)
+        }
         for i in range(2, 100):
-            candidate = f"{base_name}-{i}"
-            if candidate not in existing_names:
-                return candidate
+            if str(i) not in taken:
+                return prefix + str(i)
 
         # Fallback: use timestamp
         timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -155,18 +341,29 @@ class TmuxManager:
     def _server(self):
         if not self._libtmux:
             return None
+        if self._server_instance is not None:
+            return self._server_instance
         try:
-            return self._libtmux.Server()
+            self._server_instance = self._libtmux.Server()
         except Exception as exc:  # pragma: no cover - defensive
             raise TmuxError(f"tmux server unavailable: {exc}") from exc
+        return self._server_instance
+
+    def list_sessions(self, sort_mode: SortMode = DEFAULT_SORT_MODE) -> list[SessionInfo]:
+        cached = self._sessions_cache
+        if cached is not None and time.monotonic() - cached[0] < _SESSIONS_TTL:
+            # Rapid re-listings (e.g. cycling sort modes) only re-sort
+            return self._sort_sessions(cached[1], sort_mode)
 
-    def list_sessions(self, sort_mode: SortMode = SortMode.DEFAULT) -> list[SessionInfo]:
-        sessions = self._get_sessions_raw()
+        generation = self._sessions_generation
+        # Always the CLI: libtmux would read each session's windows with its
+        # own tmux call
+        sessions, snapshot = self._list_sessions_and_panes_cli()
 
         # Detect AI sessions and enrich session info
         sessions_with_ai = []
         for session in sessions:
-            is_ai = self._is_ai_session(session.name)
+            is_ai = self._is_ai_session(session.name, snapshot)
             sessions_with_ai.append(
                 SessionInfo(
                     name=session.name,
@@ -175,10 +372,17 @@ class TmuxManager:
                     is_ai_session=is_ai,
                 )
             )
+        if generation == self._sessions_generation:
+            self._sessions_cache = (time.monotonic(), sessions_with_ai)
 
         # Sort based on the selected mode
         return self._sort_sessions(sessions_with_ai, sort_mode)
 
+    def invalidate_sessions(self) -> None:
+        """Drop the cached session listing so the next call queries tmux."""
+        self._sessions_generation += 1
+        self._sessions_cache = None
+
     def most_recent_session(self) -> SessionInfo | None:
         """Return the most recently active tmux session if available."""
         sessions_with_activity = self._list_sessions_activity_cli()
@@ -190,39 +394,8 @@ class TmuxManager:
 
     def _sort_sessions(self, sessions: list[SessionInfo], mode: SortMode) -> list[SessionInfo]:
         """Sort sessions according to the specified mode."""
-        if mode == SortMode.NAME:
-            # Alphabetical A→Z
-            return sorted(sessions, key=lambda s: s.name.lower())
-        elif mode == SortMode.ACTIVITY:
-            # Active/attached first, then by name
-            return sorted(sessions, key=lambda s: (not s.attached, s.name.lower()))
-        elif mode == SortMode.AI_FIRST:
-            # AI sessions first, then by name
-            return sorted(sessions, key=lambda s: (not s.is_ai_session, s.name.lower()))
-        elif mode == SortMode.WINDOWS_COUNT:
-            # Most windows first, then by name
-            return sorted(sessions, key=lambda s: (-s.windows, s.name.lower()))
-        else:
-            # Default to AI_FIRST
-            return sorted(sessions, key=lambda s: (not s.is_ai_session, s.name.lower()))
-
-    def _get_sessions_raw(self) -> list[SessionInfo]:
-        if self._libtmux:
-            try:
-                server = self._server()
-                sessions = list(server.sessions) if server else []
-                return [
-                    SessionInfo(
-                        name=session.name,
-                        attached=self._normalize_attached(getattr(session, "attached", False)),
-                        windows=len(getattr(session, "windows", []) or []),
-                    )
-                    for session in sessions
-                ]
-            except Exception:
-                return []
-
-        return self._list_sessions_cli()
+        # sorted() computes each session's key once
+        return sorted(sessions, key=_SORT_KEYS.get(mode, _SORT_KEYS[DEFAULT_SORT_MODE]))
 
     def _list_sessions_activity_cli(self) -> list[tuple[SessionInfo, int]]:
         try:
@@ -247,17 +420,17 @@ class TmuxManager:
         for line in result.stdout.splitlines():
             if not line.strip():
                 continue
-            parts = (line.split("::", 4) + ["", "", "", "", ""])[:5]
+            parts = line.split("::", 4)
+            if len(parts) != 5:
+                continue
             name, attached, windows, activity, last_attached = parts
-            activity_ts = int(activity) if activity.isdigit() else 0
-            last_attached_ts = int(last_attached) if last_attached.isdigit() else 0
-            score = max(activity_ts, last_attached_ts)
+            score = max(_safe_int(activity), _safe_int(last_attached))
             sessions.append(
                 (
                     SessionInfo(
                         name=name,
                         attached=self._normalize_attached(attached),
-                        windows=int(windows) if windows.isdigit() else 0,
+                        windows=_safe_int(windows),
                     ),
                     score,
                 )
@@ -265,65 +438,97 @@ class TmuxManager:
 
         return sessions
 
-    def _is_ai_session(self, session_name: str) -> bool:
-        """Check if a session contains an AI agent by checking pane commands."""
+    def _is_ai_session(
+        self,
+        session_name: str,
+        snapshot: dict[str, list[str]] | None = None,
+    ) -> bool:
+        """Check if a session contains an AI agent by checking pane commands.
+
+        ``snapshot`` maps session names to pane commands from a server-wide
+        listing; without it the session's panes are queried directly.
+        """
+        if snapshot is not None:
+            commands = tuple(snapshot.get(session_name, ()))
+        else:
+            commands = self._pane_commands(session_name)
+        cached = self._ai_session_cache.get(session_name)
+        if cached is not None and cached[0] == commands:
+            return cached[1]
+
+        # Scan the pane commands and, as a last resort, the session name in one
+        # pass; keywords never contain a newline, so matches cannot straddle lines
+        is_ai = not _AI_KEYWORD_SET.isdisjoint(commands) or _contains_ai_keyword(
+            "\n".join((*commands, session_name))
+        )
+        with self._ai_cache_lock:
+            cache = self._ai_session_cache
+            if len(cache) >= _AI_SESSION_CACHE_SIZE:
+                # Evict the oldest entry
+                del cache[next(iter(cache))]
+            cache[session_name] = (commands, is_ai)
+        return is_ai
+
+    def _pane_commands(self, session_name: str) -> tuple[str, ...]:
+        """Return the current command of every pane in a session."""
         # Try libtmux first
         if self._libtmux:
             try:
                 details = self.get_session_details(session_name)
                 if details:
-                    for window in details.windows:
-                        for pane in window.panes:
-                            if pane.current_command:
-                                cmd_lower = pane.current_command.lower()
-                                if any(keyword in cmd_lower for keyword in AI_KEYWORDS):
-                                    return True
+                    commands = tuple(
+                        pane.current_command
+                        for window in details.windows
+                        for pane in window.panes
+                        if pane.current_command
+                    )
+                    if commands:
+                        return commands
             except Exception:
                 pass  # Fall through to CLI method
 
         # CLI fallback: get pane commands directly from tmux
         try:
             result = subprocess.run(
-                ["tmux", "list-panes", "-t", session_name, "-F", "#{pane_current_command}"],
+                (*_LIST_PANES_ARGS, session_name, *_LIST_PANES_F_COMMANDS),
                 capture_output=True,
                 text=True,
                 timeout=2,
             )
             if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    if any(keyword in line.lower() for keyword in AI_KEYWORDS):
-                        return True
+                return tuple(line for line in result.stdout.splitlines() if line)
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
+        return ()
 
-        # Last resort: check session name for AI keywords
-        return any(keyword in session_name.lower() for keyword in AI_KEYWORDS)
+    def _list_sessions_and_panes_cli(self) -> tuple[list[SessionInfo], dict[str, list[str]]]:
+        """List sessions and snapshot every pane with a single tmux process.
 
-    def _list_sessions_cli(self) -> list[SessionInfo]:
-        result = subprocess.run(
-            ["tmux", "list-sessions", "-F", "#{session_name}:#{session_attached}:#{session_windows}"],
-            capture_output=True,
-            text=True,
-        )
+        Both commands run in one invocation (``tmux a ; b``); a one-byte tag
+        on each line tells the two listings apart.
+        """
+        try:
+            result = subprocess.run(_LIST_SESSIONS_AND_PANES_ARGS, capture_output=True)
+        except FileNotFoundError as exc:
+            raise TmuxError("tmux executable not found") from exc
         if result.returncode != 0:
-            if "no server running" in result.stderr.lower():
-                return []
-            raise TmuxError(result.stderr.strip() or "tmux list-sessions failed")
+            stderr = result.stderr.decode(errors="replace")
+            if "no server running" in stderr.lower():
+                return [], {}
+            raise TmuxError(stderr.strip() or "tmux list-sessions failed")
 
         sessions: list[SessionInfo] = []
+        snapshot: dict[str, list[str]] = {}
         for line in result.stdout.splitlines():
-            if not line.strip():
-                continue
-            name, attached, windows = (line.split(":", 2) + ["", ""])[:3]
-            sessions.append(
-                SessionInfo(
-                    name=name,
-                    attached=self._normalize_attached(attached),
-                    windows=int(windows) if windows.isdigit() else 0,
-                )
-            )
-        return sessions
-
+            tag = line[:1]
+            if tag == b"S":
+                if line[1:].strip():
+                    sessions.append(_parse_session_line(line[1:]))
+            elif tag == b"P":
+                _add_pane_line(snapshot, line[1:])
+        return sessions, snapshot
+
+    @_invalidates_sessions
     def create_session(self, name: str) -> None:
         if self._libtmux:
             server = self._server()
@@ -336,6 +541,7 @@ class TmuxManager:
         if result.returncode != 0:
             raise TmuxError(result.stderr.strip() or "tmux new-session failed")
 
+    @_invalidates_sessions
     def create_session_with_cd(self, name: str, directory: str | None = None) -> None:
         """Create a new tmux session and automatically cd to the specified directory.
 
@@ -347,7 +553,7 @@ class TmuxManager:
         """
         # Determine the directory to cd into
         if directory is None:
-            target_dir = str(Path.cwd())
+            target_dir = self._cwd()
         else:
             target_dir = directory
 
@@ -364,19 +570,27 @@ class TmuxManager:
             self._rename_window(name, name)
             return
 
-        # Use tmux CLI with -c to set the start directory
+        # Use tmux CLI with -c to set the start directory, then name the window
+        # and clear it, all chained in one tmux invocation
+        arg_name = _escape_tmux_arg(name)
         result = subprocess.run([
-            "tmux", "new-session", "-d", "-s", name, "-c", target_dir
+            "tmux", "new-session", "-d", "-P", "-F", "#{session_id}",
+            "-s", arg_name, "-c", _escape_tmux_arg(target_dir),
+            ";", "rename-window", "-t", arg_name, arg_name,
+            ";", "send-keys", "-t", arg_name, "clear", "Enter",
         ], capture_output=True, text=True)
 
         if result.returncode != 0:
-            raise TmuxError(result.stderr.strip() or "tmux new-session failed")
-
-        self._rename_window(name, name)
-        # Send the clear command to the first window
-        subprocess.run([
-            "tmux", "send-keys", "-t", f"{name}:0", "clear", "Enter"
-        ], capture_output=True)
+            # -P prints the new session id, so empty stdout means new-session
+            # itself failed; the follow-up commands are best effort
+            if not result.stdout.strip():
+                raise TmuxError(result.stderr.strip() or "tmux new-session failed")
+            if self._logger is not None:
+                self._logger.warn(
+                    "create",
+                    f"window rename/clear failed: {result.stderr.strip() or result.returncode}",
+                    name,
+                )
 
     def attach_command(self, name: str) -> list[str]:
         # Check if already inside tmux
@@ -387,6 +601,7 @@ class TmuxManager:
         # Not inside tmux - use attach-session
         return ["tmux", "attach-session", "-t", name]
 
+    @_invalidates_sessions
     def rename_session_to_project(self, session_name: str) -> str | None:
         """Rename a session to match the session's active pane directory basename.
 
@@ -429,7 +644,10 @@ class TmuxManager:
 
         return None
 
+    @_invalidates_sessions
     def kill_session(self, name: str) -> None:
+        with self._ai_cache_lock:
+            self._ai_session_cache.pop(name, None)
         if self._libtmux:
             server = self._server()
             if server is None:
@@ -441,7 +659,10 @@ class TmuxManager:
         if result.returncode != 0:
             raise TmuxError(result.stderr.strip() or "tmux kill-session failed")
 
+    @_invalidates_sessions
     def rename_session(self, old_name: str, new_name: str) -> None:
+        with self._ai_cache_lock:
+            self._ai_session_cache.pop(old_name, None)
         if self._libtmux:
             server = self._server()
             if server is None:
@@ -502,9 +723,13 @@ class TmuxManager:
                 timeout=2,
             )
             if result.returncode == 0:
-                lines = result.stdout.splitlines()
-                # Take last N lines for preview
-                return lines[-15:] if len(lines) > 15 else lines
+                output = result.stdout
+                if not output:
+                    return []
+                if output.endswith("\n"):
+                    output = output[:-1]
+                # Take last N lines for preview, splitting only the tail
+                return output.rsplit("\n", _PREVIEW_TAIL_LINES)[-_PREVIEW_TAIL_LINES:]
         except (subprocess.TimeoutExpired, FileNotFoundError):
             pass
         return None
@@ -4,17 +4,18 @@ from __future__ import annotations
 
 import curses
 from dataclasses import dataclass
+from enum import IntFlag
 
-from .models import SessionInfo, SortMode, WindowInfo
+from .models import DATACLASS_SLOTS, DEFAULT_SORT_MODE, SessionInfo, SortMode, WindowInfo
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UiStatus:
     message: str
     level: str = "info"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class UiState:
     sessions: list[SessionInfo]
     selected_index: int
@@ -24,7 +25,41 @@ class UiState:
     status: UiStatus | None
     preview: list[WindowInfo] | None
     pane_capture: list[str] | None = None
-    sort_mode: SortMode = SortMode.DEFAULT
+    sort_mode: SortMode = DEFAULT_SORT_MODE
+    refreshing: bool = False
+
+
+class Region(IntFlag):
+    """Screen regions that can be redrawn independently."""
+
+    NONE = 0
+    TITLE = 1
+    SESSIONS = 2
+    PREVIEW = 4
+    FOOTER = 8
+    ALL = TITLE | SESSIONS | PREVIEW | FOOTER
+
+
+def dirty_regions(prev: UiState | None, state: UiState) -> Region:
+    """Return the regions whose content differs between two frames."""
+    if prev is None or prev.help_visible != state.help_visible:
+        # Toggling the overlay exposes or hides cells in every region
+        return Region.ALL
+    dirty = Region.NONE
+    if prev.sort_mode != state.sort_mode:
+        dirty |= Region.TITLE | Region.FOOTER
+    if prev.selected_index != state.selected_index or prev.sessions != state.sessions:
+        dirty |= Region.SESSIONS
+    if prev.preview != state.preview or prev.pane_capture != state.pane_capture:
+        dirty |= Region.PREVIEW
+    if (
+        prev.status != state.status
+        or prev.in_search != state.in_search
+        or prev.filter_text != state.filter_text
+        or prev.refreshing != state.refreshing
+    ):
+        dirty |= Region.FOOTER
+    return dirty
 
 
 # Margin settings (top, left) - in terminal cells
@@ -34,6 +69,9 @@ MARGIN_LEFT = 4
 # Line spacing (0 = compact, 1 = normal spacing, 2 = double spacing)
 LINE_SPACING = 0
 
+# Upper bound on cached session row labels
+_LABEL_CACHE_SIZE = 512
+
 
 class DashboardUI:
     def __init__(self, stdscr: curses._CursesWindow, color_mode: str) -> None:
@@ -41,6 +79,18 @@ class DashboardUI:
         self.color_mode = color_mode
         self.colors_enabled = False
         self.color_pairs: dict[str, int] = {}
+        # Resolved attributes per name, filled once by init()
+        self._attrs: dict[str, int] = {"selected": curses.A_REVERSE}
+        self._size: tuple[int, int] | None = None
+        # Off-screen pad holding the full session list; visible rows are
+        # copied onto stdscr so scrolling never re-renders every label.
+        self.list_pad: curses._CursesWindow | None = None
+        self._pad_rows = 0
+        self._pad_cols = 0
+        self._pad_sessions: list[SessionInfo] | None = None
+        self._pad_selected = -1
+        # Formatted row labels keyed by everything that appears in them
+        self._label_cache: dict[tuple, str] = {}
 
     def init(self) -> None:
         curses.noecho()
@@ -78,10 +128,19 @@ class DashboardUI:
                 "help": 7,
                 "ai_session": 8,
             }
+            self._attrs = {name: curses.color_pair(pair) for name, pair in self.color_pairs.items()}
 
-    def render(self, state: UiState, preview_lines: int) -> None:
-        self.stdscr.erase()
+    def render(self, state: UiState, preview_lines: int, dirty: Region = Region.ALL) -> None:
         height, width = self.stdscr.getmaxyx()
+        if (height, width) != self._size:
+            # Terminal was resized: the whole layout moves
+            self._size = (height, width)
+            dirty = Region.ALL
+        if not dirty:
+            return
+        full = dirty == Region.ALL
+        if full:
+            self.stdscr.erase()
 
         # Apply margins
         content_top = MARGIN_TOP
@@ -89,16 +148,32 @@ class DashboardUI:
         content_width = max(1, width - MARGIN_LEFT * 2)
         content_height = max(1, height - MARGIN_TOP * 2)
 
-        self._draw_title(state, content_top, content_left, content_width)
         list_top = content_top + 2
         list_bottom = max(content_top + 3, content_top + content_height - 3)
         list_height = list_bottom - list_top + 1
         list_width = max(30, int(content_width * 0.55))
         preview_left = content_left + list_width + 2
 
-        self._draw_sessions(state, list_top, list_height, list_width, content_left)
-        self._draw_preview(state, list_top, list_height, preview_left, width, preview_lines)
-        self._draw_footer(state, height, width, content_left)
+        if dirty & Region.TITLE:
+            if not full:
+                self._clear_line(content_top, 0)
+            self._draw_title(state, content_top, content_left, content_width)
+        if dirty & Region.SESSIONS:
+            if not full and not state.sessions:
+                blank = " " * max(0, min(preview_left, width - 1) - content_left)
+                for row in range(list_top, list_top + list_height):
+                    self._addstr(row, content_left, blank)
+            self._draw_sessions(state, list_top, list_height, list_width, content_left)
+        if dirty & Region.PREVIEW:
+            if not full:
+                for row in range(list_top, list_top + list_height):
+                    self._clear_line(row, preview_left)
+            self._draw_preview(state, list_top, list_height, preview_left, width, preview_lines)
+        if dirty & Region.FOOTER:
+            if not full:
+                self._clear_line(height - 2, 0)
+                self._clear_line(height - 1, 0)
+            self._draw_footer(state, height, width, content_left)
 
         if state.help_visible:
             self._draw_help_overlay(width, height)
@@ -119,35 +194,87 @@ class DashboardUI:
             self._addstr(top, left, "No sessions found. Press 'n' to create one.")
             return
 
-        start = max(0, state.selected_index - height + 1)
-        end = min(len(sessions), start + height)
-
-        for idx, session in enumerate(sessions[start:end], start=start):
-            row = top + (idx - start) * (1 + LINE_SPACING)
-
-            # Number prefix for quick attach (only show for first 9)
-            if idx < 9:
-                num_prefix = f"{idx + 1}. "
-            else:
-                num_prefix = "  "
-            # AI indicator
-            ai_prefix = "🤖 " if session.is_ai_session else ""
-            name = ai_prefix + session.name
-            status = "attached" if session.attached else "detached"
-            windows = f"windows: {session.windows}"
-            label = f"{num_prefix}{name:<18} [{status:<8}] {windows}"
-
-            attr = 0
-            if idx == state.selected_index:
-                attr = self._attr("selected")
-            elif session.is_ai_session:
-                attr = self._attr("ai_session")
-            elif session.attached:
-                attr = self._attr("attached")
-            else:
-                attr = self._attr("detached")
-
-            self._addstr(row, left, label[: width - 1], attr)
+        step = 1 + LINE_SPACING
+        # The pad also covers the gap before the preview column
+        pad_cols = width + 2
+        pad_rows = max(256, len(sessions) * step + height)
+        if self.list_pad is None or pad_cols != self._pad_cols or pad_rows > self._pad_rows:
+            try:
+                self.list_pad = curses.newpad(pad_rows, pad_cols)
+            except curses.error:
+                self.list_pad = None
+                return
+            self._pad_rows = pad_rows
+            self._pad_cols = pad_cols
+            self._pad_sessions = None
+
+        selected = state.selected_index
+        if sessions != self._pad_sessions:
+            self.list_pad.erase()
+            for idx, session in enumerate(sessions):
+                self._draw_session_row(idx, session, idx == selected, width)
+            self._pad_sessions = sessions
+        elif selected != self._pad_selected:
+            # Only the highlight moved: repaint the old and new rows
+            if 0 <= self._pad_selected < len(sessions):
+                self._draw_session_row(
+                    self._pad_selected, sessions[self._pad_selected], False, width
+                )
+            self._draw_session_row(selected, sessions[selected], True, width)
+        self._pad_selected = selected
+
+        screen_height, screen_width = self._size or self.stdscr.getmaxyx()
+        start = max(0, selected - height + 1)
+        bottom = min(top + height, screen_height) - 1
+        right = min(left + pad_cols, screen_width) - 1
+        if bottom < top or right < left:
+            return
+        try:
+            self.list_pad.overwrite(self.stdscr, start * step, 0, top, left, bottom, right)
+        except curses.error:
+            pass
+
+    def _session_label(self, idx: int, session: SessionInfo, width: int) -> str:
+        # Rows past the ninth share a prefix, so they share cache entries too
+        key = (min(idx, 9), session.name, session.attached, session.windows, session.is_ai_session, width)
+        label = self._label_cache.get(key)
+        if label is not None:
+            return label
+
+        # Number prefix for quick attach (only show for first 9)
+        if idx < 9:
+            num_prefix = f"{idx + 1}. "
+        else:
+            num_prefix = "  "
+        # AI indicator
+        ai_prefix = "🤖 " if session.is_ai_session else ""
+        name = ai_prefix + session.name
+        status = "attached" if session.attached else "detached"
+        windows = f"windows: {session.windows}"
+        label = f"{num_prefix}{name:<18} [{status:<8}] {windows}"[: width - 1]
+
+        if len(self._label_cache) >= _LABEL_CACHE_SIZE:
+            self._label_cache.clear()
+        self._label_cache[key] = label
+        return label
+
+    def _draw_session_row(self, idx: int, session: SessionInfo, selected: bool, width: int) -> None:
+        label = self._session_label(idx, session, width)
+
+        attr = 0
+        if selected:
+            attr = self._attr("selected")
+        elif session.is_ai_session:
+            attr = self._attr("ai_session")
+        elif session.attached:
+            attr = self._attr("attached")
+        else:
+            attr = self._attr("detached")
+
+        try:
+            self.list_pad.addstr(idx * (1 + LINE_SPACING), 0, label, attr)
+        except curses.error:
+            pass
 
     def _draw_preview(
         self,
@@ -196,6 +323,8 @@ class DashboardUI:
             footer = "Help: F1/? to close"
 
         status_msg = state.status.message if state.status else ""
+        if state.refreshing:
+            status_msg = f"{status_msg}  (refreshing…)" if status_msg else "refreshing…"
         status_line = status_msg[: max(0, width - left - 1)]
 
         footer_line = footer[: max(0, width - left - 1)]
@@ -229,19 +358,26 @@ class DashboardUI:
             self._addstr(top + idx, left + 2, line, self._attr("help"))
 
     def _attr(self, name: str) -> int:
-        if not self.colors_enabled:
-            if name == "selected":
-                return curses.A_REVERSE
-            return 0
-        pair = self.color_pairs.get(name, 0)
-        return curses.color_pair(pair)
+        return self._attrs.get(name, 0)
+
+    def _clear_line(self, y: int, x: int) -> None:
+        try:
+            self.stdscr.move(y, x)
+            self.stdscr.clrtoeol()
+        except curses.error:
+            pass
 
     def _addstr(self, y: int, x: int, text: str, attr: int = 0) -> None:
-        height, width = self.stdscr.getmaxyx()
+        if not text:
+            return
+        # render() stores the size once per frame
+        height, width = self._size or self.stdscr.getmaxyx()
         if y < 0 or y >= height or x < 0 or x >= width:
             return
         if x + len(text) >= width:
             text = text[: max(0, width - x - 1)]
+            if not text:
+                return
         try:
             self.stdscr.addstr(y, x, text, attr)
         except curses.error:
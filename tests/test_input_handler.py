@@ -0,0 +1,41 @@
+"""Unit tests for the dashboard loop's resize wakeup."""
+
+from __future__ import annotations
+
+import os
+import signal
+import unittest
+from unittest.mock import patch
+
+from tmux_dashboard import input_handler
+
+
+class TestResizeWakeup(unittest.TestCase):
+    def setUp(self) -> None:
+        self.wakeup_r, self.wakeup_w = os.pipe()
+        os.set_blocking(self.wakeup_r, False)
+        self.previous = input_handler._install_resize_handler(self.wakeup_w)
+
+    def tearDown(self) -> None:
+        signal.signal(signal.SIGWINCH, self.previous)
+        input_handler._resize_pending = False
+        os.close(self.wakeup_r)
+        os.close(self.wakeup_w)
+
+    def test_sigwinch_writes_to_wakeup_pipe(self) -> None:
+        os.kill(os.getpid(), signal.SIGWINCH)
+        self.assertEqual(os.read(self.wakeup_r, 4096), b"\0")
+        self.assertTrue(input_handler._resize_pending)
+
+    def test_pending_resize_is_applied_once(self) -> None:
+        os.kill(os.getpid(), signal.SIGWINCH)
+        with patch.object(input_handler.os, "get_terminal_size", return_value=os.terminal_size((100, 30))), \
+                patch.object(input_handler.curses, "resizeterm") as resizeterm:
+            input_handler._apply_pending_resize()
+            input_handler._apply_pending_resize()
+        resizeterm.assert_called_once_with(30, 100)
+        self.assertFalse(input_handler._resize_pending)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
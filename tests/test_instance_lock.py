@@ -1,6 +1,9 @@
 """Unit tests for single instance enforcement."""
 
 import os
+import signal
+import subprocess
+import sys
 import tempfile
 import threading
 import time
@@ -13,6 +16,7 @@ from tmux_dashboard.instance_lock import (
     InstanceLockError,
     LockAcquisitionError,
     LockFileError,
+    _pid_alive,
     cleanup_stale_locks,
     ensure_single_instance,
     get_status,
@@ -60,6 +64,17 @@ class TestInstanceLock(unittest.TestCase):
                 self.assertEqual(lock.lock_file, lock_path)
                 self.assertEqual(lock.pid_file, pid_path)
 
+    def test_directories_created_lazily(self):
+        """Test that only acquire() creates the lock directory."""
+        nested = self.temp_dir / "nested" / "state"
+        lock = InstanceLock(lock_file=nested / "lock", pid_file=nested / "pid", timeout=0.1)
+        self.assertFalse(nested.exists())
+        self.assertFalse(lock.is_locked())
+        self.assertFalse(nested.exists())
+        self.assertTrue(lock.acquire())
+        self.assertTrue(nested.is_dir())
+        lock.release()
+
     def test_double_acquire_fails(self):
         """Test that acquiring the same lock twice fails."""
         self.assertTrue(self.lock.acquire())
@@ -93,12 +108,59 @@ class TestInstanceLock(unittest.TestCase):
         self.assertTrue(lock.is_locked())
         lock.release()
 
-    def test_pid_file_cleanup(self):
-        """Test that PID files are cleaned up properly."""
+    def test_pid_stored_in_lock_file(self):
+        """Test that the fcntl path keeps the PID in the lock file only."""
+        with self.lock:
+            self.assertFalse(self.pid_file.exists())
+            self.assertEqual(self.lock_file.read_text().strip(), str(os.getpid()))
+            self.assertEqual(self.lock.get_lock_info()['locking_pid'], str(os.getpid()))
+        self.assertEqual(self.lock_file.read_text(), "")
+
+    def test_failed_pid_write_does_not_mark_lock_held(self):
+        """Test that a lock whose PID write failed is not remembered as ours."""
+        lock = InstanceLock(lock_file=self.lock_file, pid_file=self.pid_file, timeout=0.1)
+        with patch('os.write', side_effect=OSError(28, "No space left on device")):
+            self.assertFalse(lock.acquire())
+        self.assertIsNone(InstanceLock._OWNER_FD)
+        other = InstanceLock(lock_file=self.lock_file, pid_file=self.pid_file, timeout=0.1)
+        self.assertTrue(other.acquire())
+        other.release()
+
+    def test_release_unlocks_when_truncate_fails(self):
+        """Test that a failed truncate still unlocks and closes the lock fd."""
+        self.assertTrue(self.lock.acquire())
+        fd = self.lock._lock_fd
+        with patch('os.ftruncate', side_effect=OSError(30, "Read-only file system")):
+            self.lock.release()
+        self.assertIsNone(self.lock._lock_fd)
+        with self.assertRaises(OSError):
+            os.fstat(fd)
+        other = InstanceLock(lock_file=self.lock_file, pid_file=self.pid_file, timeout=0.1)
+        self.assertTrue(other.acquire())
+        other.release()
+
+    @patch('fcntl.flock')
+    def test_pid_file_cleanup(self, mock_flock):
+        """Test that PID files are cleaned up properly in the fallback path."""
+        mock_flock.side_effect = OSError("fcntl failed")
         with self.lock:
             self.assertTrue(self.pid_file.exists())
         self.assertFalse(self.pid_file.exists())
 
+    def test_pid_file_written_atomically(self):
+        """Test that the PID file is complete and no temp file is left behind."""
+        self.assertTrue(self.lock._write_pid_file())
+        self.assertEqual(self.pid_file.read_text(), str(os.getpid()))
+        leftovers = [p for p in self.temp_dir.iterdir() if ".tmp." in p.name]
+        self.assertEqual(leftovers, [])
+
+    def test_empty_pid_file_is_replaced(self):
+        """Test that an empty PID file does not block the PID fallback."""
+        self.pid_file.write_text("")
+        self.assertTrue(self.lock._try_pid_file_lock())
+        self.assertEqual(self.pid_file.read_text(), str(os.getpid()))
+        self.lock.release()
+
     def test_stale_pid_file_cleanup(self):
         """Test cleanup of stale PID files."""
         # Create a stale PID file
@@ -222,6 +284,48 @@ class TestRaceConditions(unittest.TestCase):
         success_count = results.count("success")
         self.assertEqual(success_count, 1, f"Expected 1 success, got {success_count}")
 
+    def test_blocking_acquire_waits_for_release(self):
+        """Test that acquire keeps retrying until another process drops the lock."""
+        holder = subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import fcntl, os, sys, time\n"
+                "fd = os.open(sys.argv[1], os.O_CREAT | os.O_WRONLY)\n"
+                "fcntl.flock(fd, fcntl.LOCK_EX)\n"
+                "print('ready', flush=True)\n"
+                "time.sleep(0.3)\n",
+                str(self.lock_file),
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            holder.stdout.readline()
+            lock = InstanceLock(lock_file=self.lock_file, pid_file=self.pid_file, timeout=5.0)
+            start_time = time.monotonic()
+            self.assertTrue(lock.acquire())
+            self.assertLess(time.monotonic() - start_time, 2.0)
+            lock.release()
+        finally:
+            holder.wait()
+            holder.stdout.close()
+
+    def test_acquire_leaves_host_timer_alone(self):
+        """Test that waiting for the lock does not cancel the caller's ITIMER_REAL."""
+        lock1 = InstanceLock(lock_file=self.lock_file, pid_file=self.pid_file)
+        self.assertTrue(lock1.acquire())
+        previous = signal.signal(signal.SIGALRM, lambda signum, frame: None)
+        try:
+            signal.setitimer(signal.ITIMER_REAL, 30)
+            lock2 = InstanceLock(lock_file=self.lock_file, pid_file=self.pid_file, timeout=0.1)
+            self.assertFalse(lock2.acquire())
+            self.assertGreater(signal.getitimer(signal.ITIMER_REAL)[0], 0)
+        finally:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, previous)
+            lock1.release()
+
     def test_timeout_handling(self):
         """Test timeout handling when lock cannot be acquired."""
         # Acquire lock first
@@ -356,6 +460,11 @@ class TestErrorHandling(unittest.TestCase):
             # Restore permissions
             self.temp_dir.chmod(0o755)
 
+    def test_pid_alive(self):
+        """Test process liveness probing."""
+        self.assertTrue(_pid_alive(os.getpid()))
+        self.assertFalse(_pid_alive(999999))  # Non-existent PID
+
     def test_exception_hierarchy(self):
         """Test exception class hierarchy."""
         self.assertTrue(issubclass(LockAcquisitionError, InstanceLockError))
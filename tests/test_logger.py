@@ -1,6 +1,7 @@
 """Unit tests for the logger."""
 
 import io
+import json
 import tempfile
 import unittest
 from pathlib import Path
@@ -39,6 +40,71 @@ class TestLogger(unittest.TestCase):
             output = stderr_capture.getvalue().strip().splitlines()
             self.assertEqual(len(output), 1)
 
+    def test_appends_jsonl_records(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "nested" / "log.jsonl"
+            logger = Logger(log_path)
+
+            logger.info("event1", "first", session_name="alpha")
+            logger.error("event2", "second")
+
+            records = [json.loads(line) for line in log_path.read_text().splitlines()]
+            logger.close()
+
+            self.assertEqual([r["event"] for r in records], ["event1", "event2"])
+            self.assertEqual(records[0]["session_name"], "alpha")
+            self.assertEqual(records[1]["level"], "ERROR")
+
+    def test_fallback_record_matches_json_dumps(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            log_path = Path(temp_dir) / "log.jsonl"
+            logger = Logger(log_path)
+
+            with patch.object(logger_module, "orjson", None):
+                logger.warn("evt", 'quote " and \u00e9', session_name=None)
+            logger.close()
+
+            line = log_path.read_text(encoding="utf-8").rstrip("\n")
+            record = json.loads(line)
+            self.assertEqual(line, json.dumps(record, ensure_ascii=False, separators=(",", ":")))
+            self.assertEqual(record["message"], 'quote " and \u00e9')
+            self.assertIsNone(record["session_name"])
+
+    @unittest.skipIf(logger_module.orjson is None, "orjson not installed")
+    def test_fallback_record_matches_orjson(self) -> None:
+        messages = ["plain", 'quote " \\ /', "tab\tnew\nline\x01\x7f", "caf\u00e9 \u2028 \U0001f916"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            fast_path = Path(temp_dir) / "fast.jsonl"
+            slow_path = Path(temp_dir) / "slow.jsonl"
+            fast, slow = Logger(fast_path), Logger(slow_path)
+            with patch.object(logger_module, "_timestamp", return_value="2026-01-16T12:00:00.000+03:00"):
+                for message in messages:
+                    fast.info("evt", message, session_name="s\u00e9")
+                    fast.error("evt", message)
+                    with patch.object(logger_module, "orjson", None):
+                        slow.info("evt", message, session_name="s\u00e9")
+                        slow.error("evt", message)
+            fast.close()
+            slow.close()
+            self.assertEqual(fast_path.read_bytes(), slow_path.read_bytes())
+
+    def test_close_unregisters_exit_hook(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            logger = Logger(Path(temp_dir) / "log.jsonl")
+            with patch("atexit.register") as register, patch("atexit.unregister") as unregister:
+                for _ in range(3):
+                    logger.info("event", "message")
+                    logger.close()
+            self.assertEqual(register.call_count, 3)
+            self.assertEqual(unregister.call_args_list, register.call_args_list)
+
+    def test_timestamp_cached_within_millisecond(self) -> None:
+        with patch("time.time_ns", return_value=1_700_000_000_123_456_789):
+            first = logger_module._timestamp()
+            second = logger_module._timestamp()
+        self.assertIs(first, second)
+        self.assertEqual(first, "2023-11-15T01:13:20.123+03:00")
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
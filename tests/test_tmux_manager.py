@@ -0,0 +1,243 @@
+"""Unit tests for tmux manager helpers."""
+
+from __future__ import annotations
+
+import subprocess
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tmux_dashboard import tmux_manager
+from tmux_dashboard.models import SessionInfo, SortMode
+from tmux_dashboard.tmux_manager import TmuxManager, _contains_ai_keyword
+
+
+class TestAiKeywords(unittest.TestCase):
+    CASES = {
+        "claude": True,
+        "Claude-Code": True,
+        "node /usr/bin/copilot": True,
+        "bash": False,
+        "": False,
+        "vim": False,
+    }
+
+    def test_contains_ai_keyword(self) -> None:
+        for value, expected in self.CASES.items():
+            with self.subTest(value=value):
+                self.assertEqual(_contains_ai_keyword(value), expected)
+
+    def test_contains_ai_keyword_without_automaton(self) -> None:
+        with patch.object(tmux_manager, "_AI_AUTOMATON", None):
+            for value, expected in self.CASES.items():
+                with self.subTest(value=value):
+                    self.assertEqual(_contains_ai_keyword(value), expected)
+
+
+class TestAiSessionCache(unittest.TestCase):
+    def test_unchanged_commands_reuse_result(self) -> None:
+        manager = TmuxManager()
+        with patch.object(manager, "_pane_commands", return_value=("bash", "claude")), patch.object(
+            tmux_manager, "_contains_ai_keyword", wraps=_contains_ai_keyword
+        ) as scan:
+            self.assertTrue(manager._is_ai_session("work"))
+            scans = scan.call_count
+            self.assertTrue(manager._is_ai_session("work"))
+            self.assertEqual(scan.call_count, scans)
+
+    def test_changed_commands_are_rescanned(self) -> None:
+        manager = TmuxManager()
+        with patch.object(manager, "_pane_commands", return_value=("claude",)):
+            self.assertTrue(manager._is_ai_session("work"))
+        with patch.object(manager, "_pane_commands", return_value=("bash",)):
+            self.assertFalse(manager._is_ai_session("work"))
+
+    def test_keywords_do_not_match_across_commands(self) -> None:
+        manager = TmuxManager()
+        with patch.object(manager, "_pane_commands", return_value=("ca", "i3")):
+            self.assertFalse(manager._is_ai_session("work"))
+
+
+class TestPaneSnapshot(unittest.TestCase):
+    def test_snapshot_groups_panes_by_session(self) -> None:
+        output = b"Pwork::bash\nPwork::claude\nPidle::vim\nPempty::\n"
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=output, stderr=b"")
+        manager = TmuxManager()
+        with patch("subprocess.run", return_value=completed) as run:
+            _, snapshot = manager._list_sessions_and_panes_cli()
+            self.assertTrue(manager._is_ai_session("work", snapshot))
+            self.assertFalse(manager._is_ai_session("idle", snapshot))
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(snapshot, {"work": ["bash", "claude"], "idle": ["vim"], "empty": []})
+
+    def test_sessions_and_panes_share_one_tmux_call(self) -> None:
+        output = b"Swork:1:2\nSidle:0:1\nPwork::claude\nPidle::vim\n"
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=output, stderr=b"")
+        manager = TmuxManager()
+        # Listing bypasses libtmux even when it is available
+        manager._libtmux = MagicMock()
+        with patch("subprocess.run", return_value=completed) as run:
+            sessions = manager.list_sessions(SortMode.NAME)
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(
+            [(s.name, s.attached, s.windows, s.is_ai_session) for s in sessions],
+            [("idle", False, 1, False), ("work", True, 2, True)],
+        )
+
+
+class TestSessionsCache(unittest.TestCase):
+    OUTPUT = b"Swork:1:2\nSidle:0:1\nPwork::claude\nPidle::vim\n"
+
+    def test_listing_is_reused_within_ttl(self) -> None:
+        completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=self.OUTPUT, stderr=b"")
+        manager = TmuxManager()
+        manager._libtmux = None
+        with patch("subprocess.run", return_value=completed) as run:
+            self.assertEqual([s.name for s in manager.list_sessions(SortMode.NAME)], ["idle", "work"])
+            self.assertEqual([s.name for s in manager.list_sessions(SortMode.AI_FIRST)], ["work", "idle"])
+            self.assertEqual(run.call_count, 1)
+            manager.invalidate_sessions()
+            manager.list_sessions()
+            self.assertEqual(run.call_count, 2)
+            with patch.object(tmux_manager.time, "monotonic", return_value=time.monotonic() + 1):
+                manager.list_sessions()
+            self.assertEqual(run.call_count, 3)
+
+    def test_mutation_during_listing_is_not_cached(self) -> None:
+        manager = TmuxManager()
+        manager._libtmux = None
+
+        def mutate_while_listing(*args, **kwargs):
+            manager.invalidate_sessions()
+            return subprocess.CompletedProcess(args=[], returncode=0, stdout=self.OUTPUT, stderr=b"")
+
+        with patch("subprocess.run", side_effect=mutate_while_listing):
+            manager.list_sessions()
+        self.assertIsNone(manager._sessions_cache)
+
+
+    def test_listing_taken_during_mutation_is_dropped(self) -> None:
+        manager = TmuxManager()
+        manager._libtmux = None
+
+        def run(cmd, *args, **kwargs):
+            if "list-sessions" in cmd:
+                return subprocess.CompletedProcess(args=cmd, returncode=0, stdout=self.OUTPUT, stderr=b"")
+            # A background refresh runs while kill-session is in flight
+            manager.list_sessions()
+            return subprocess.CompletedProcess(args=cmd, returncode=0, stdout="", stderr="")
+
+        with patch("subprocess.run", side_effect=run):
+            manager.kill_session("work")
+        self.assertIsNone(manager._sessions_cache)
+
+
+class TestSortSessions(unittest.TestCase):
+    SESSIONS = [
+        SessionInfo(name="beta", attached=False, windows=2),
+        SessionInfo(name="Alpha", attached=True, windows=1),
+        SessionInfo(name="claude", attached=False, windows=2, is_ai_session=True),
+        SessionInfo(name="alpha", attached=False, windows=3),
+    ]
+
+    def names(self, mode: SortMode) -> list[str]:
+        return [s.name for s in TmuxManager()._sort_sessions(self.SESSIONS, mode)]
+
+    def test_sort_modes(self) -> None:
+        self.assertEqual(self.names(SortMode.NAME), ["Alpha", "alpha", "beta", "claude"])
+        self.assertEqual(self.names(SortMode.ACTIVITY), ["Alpha", "alpha", "beta", "claude"])
+        self.assertEqual(self.names(SortMode.AI_FIRST), ["claude", "Alpha", "alpha", "beta"])
+        self.assertEqual(self.names(SortMode.WINDOWS_COUNT), ["alpha", "beta", "claude", "Alpha"])
+
+
+class TestServerCache(unittest.TestCase):
+    def test_server_is_built_once(self) -> None:
+        manager = TmuxManager()
+        manager._libtmux = MagicMock()
+        self.assertIs(manager._server(), manager._server())
+        self.assertEqual(manager._libtmux.Server.call_count, 1)
+
+
+class TestActiveChild(unittest.TestCase):
+    def tearDown(self) -> None:
+        TmuxManager._SESSION_ACTIVE_WINDOW_ATTR = None
+
+    def test_attribute_name_is_probed_once(self) -> None:
+        class Session:
+            active_window = "win"
+
+            @property
+            def attached_window(self):
+                raise RuntimeError("deprecated")
+
+        attrs = tmux_manager._ACTIVE_WINDOW_ATTRS
+        self.assertEqual(TmuxManager._active_child(Session(), "_SESSION_ACTIVE_WINDOW_ATTR", attrs), "win")
+        self.assertEqual(TmuxManager._SESSION_ACTIVE_WINDOW_ATTR, "active_window")
+        self.assertIsNone(TmuxManager._active_child(object(), "_SESSION_ACTIVE_WINDOW_ATTR", attrs))
+
+
+class TestCapturePane(unittest.TestCase):
+    def test_keeps_last_lines_like_splitlines(self) -> None:
+        manager = TmuxManager()
+        outputs = ["", "\n", "one\n", "x\n\n\n", "".join(f"{i}\n" for i in range(40))]
+        for output in outputs:
+            completed = subprocess.CompletedProcess(args=[], returncode=0, stdout=output, stderr="")
+            with self.subTest(output=output), patch("subprocess.run", return_value=completed):
+                self.assertEqual(manager.capture_pane_text("work"), output.splitlines()[-15:])
+
+
+class TestCreateSession(unittest.TestCase):
+    def run_create(
+        self, returncode: int, stdout: str, name: str = "work", directory: str = "/tmp"
+    ) -> tuple[MagicMock, MagicMock]:
+        completed = subprocess.CompletedProcess(args=[], returncode=returncode, stdout=stdout, stderr="boom")
+        logger = MagicMock()
+        manager = TmuxManager(logger)
+        manager._libtmux = None
+        with patch("subprocess.run", return_value=completed) as run:
+            manager.create_session_with_cd(name, directory)
+        return run, logger
+
+    def test_commands_are_chained_in_one_call(self) -> None:
+        run, _ = self.run_create(0, "$1\n")
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual(run.call_args.args[0].count(";"), 2)
+
+    def test_trailing_semicolons_are_escaped(self) -> None:
+        run, _ = self.run_create(0, "$1\n", name="foo;", directory="/tmp/a;")
+        argv = run.call_args.args[0]
+        self.assertEqual(argv.count(";"), 2)
+        self.assertIn("foo\\;", argv)
+        self.assertIn("/tmp/a\\;", argv)
+
+    def test_failed_follow_up_is_logged(self) -> None:
+        _, logger = self.run_create(1, "$1\n")
+        logger.warn.assert_called_once()
+        self.assertIn("boom", logger.warn.call_args.args[1])
+
+    def test_failed_new_session_raises(self) -> None:
+        with self.assertRaises(tmux_manager.TmuxError):
+            self.run_create(1, "")
+
+
+class TestProjectName(unittest.TestCase):
+    def test_cwd_is_read_once_until_invalidated(self) -> None:
+        manager = TmuxManager()
+        with patch("os.getcwd", return_value="/work/app") as cwd:
+            self.assertEqual(manager.detect_project_name(), "app")
+            self.assertEqual(manager.detect_project_name(), "app")
+            self.assertEqual(cwd.call_count, 1)
+        manager.invalidate()
+        with patch("os.getcwd", return_value="/"):
+            self.assertEqual(manager.detect_project_name(), "default")
+
+    def test_generate_session_name_picks_first_free_suffix(self) -> None:
+        manager = TmuxManager()
+        existing = [SessionInfo(name=name, attached=False, windows=1) for name in ("app", "app-2", "app-3", "app-x")]
+        with patch("os.getcwd", return_value="/work/app"):
+            self.assertEqual(manager.generate_session_name(existing[:0]), "app")
+            self.assertEqual(manager.generate_session_name(existing), "app-4")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
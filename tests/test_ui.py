@@ -0,0 +1,79 @@
+"""Unit tests for partial-repaint decisions in the UI."""
+
+from __future__ import annotations
+
+import unittest
+from dataclasses import replace
+from unittest.mock import MagicMock
+
+from tmux_dashboard.models import SessionInfo, SortMode
+from tmux_dashboard.ui import DashboardUI, Region, UiState, UiStatus, dirty_regions
+
+SESSIONS = [
+    SessionInfo(name="alpha", attached=False, windows=1),
+    SessionInfo(name="beta", attached=True, windows=2),
+]
+
+
+def make_state(**changes) -> UiState:
+    state = UiState(
+        sessions=SESSIONS,
+        selected_index=0,
+        filter_text="",
+        in_search=False,
+        help_visible=False,
+        status=None,
+        preview=None,
+    )
+    return replace(state, **changes)
+
+
+class TestDirtyRegions(unittest.TestCase):
+    def test_first_frame_repaints_everything(self) -> None:
+        self.assertEqual(dirty_regions(None, make_state()), Region.ALL)
+
+    def test_no_change_repaints_nothing(self) -> None:
+        self.assertEqual(dirty_regions(make_state(), make_state()), Region.NONE)
+
+    def test_selection_change_repaints_list(self) -> None:
+        self.assertEqual(dirty_regions(make_state(), make_state(selected_index=1)), Region.SESSIONS)
+
+    def test_search_text_repaints_list_and_footer(self) -> None:
+        prev = make_state(in_search=True)
+        state = make_state(in_search=True, filter_text="b", sessions=SESSIONS[1:])
+        self.assertEqual(dirty_regions(prev, state), Region.SESSIONS | Region.FOOTER)
+
+    def test_sort_mode_repaints_title_and_footer(self) -> None:
+        state = make_state(sort_mode=SortMode.NAME)
+        self.assertEqual(dirty_regions(make_state(), state), Region.TITLE | Region.FOOTER)
+
+    def test_status_and_preview_changes(self) -> None:
+        self.assertEqual(dirty_regions(make_state(), make_state(status=UiStatus("hi"))), Region.FOOTER)
+        self.assertEqual(dirty_regions(make_state(), make_state(pane_capture=["$"])), Region.PREVIEW)
+
+    def test_help_toggle_repaints_everything(self) -> None:
+        self.assertEqual(dirty_regions(make_state(), make_state(help_visible=True)), Region.ALL)
+
+
+class TestRenderResize(unittest.TestCase):
+    def test_resize_forces_full_repaint(self) -> None:
+        stdscr = MagicMock()
+        stdscr.getmaxyx.return_value = (24, 80)
+        ui = DashboardUI(stdscr, "never")
+        state = make_state(sessions=[])
+
+        ui.render(state, 10)
+        self.assertEqual(stdscr.erase.call_count, 1)
+
+        ui.render(state, 10, dirty=Region.NONE)
+        self.assertEqual(stdscr.erase.call_count, 1)
+        stdscr.refresh.reset_mock()
+
+        stdscr.getmaxyx.return_value = (30, 100)
+        ui.render(state, 10, dirty=Region.NONE)
+        self.assertEqual(stdscr.erase.call_count, 2)
+        stdscr.refresh.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)